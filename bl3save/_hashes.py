@@ -0,0 +1,295 @@
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+# Inventory path hashes, as used in the profile for weapon customizations
+# and key counts.  The hashes for all the paths we use ourselves are
+# precomputed into `_pathhashes.py` by `resources/gen_path_hashes.py`, so
+# importing this doesn't have to compute any of them.
+
+import operator
+import functools
+import threading
+import collections
+
+from ._pathhashes import path_hashes as _precomputed_path_hashes
+
+# CRC32 table used to compute weapon customization hashes in the profile.  Many
+# thanks to Gibbed, yet again, for supplying this!
+_weapon_cust_crc32_table = [
+        0x00000000, 0x04C11DB7, 0x09823B6E, 0x0D4326D9, 0x130476DC, 0x17C56B6B, 0x1A864DB2, 0x1E475005,
+        0x2608EDB8, 0x22C9F00F, 0x2F8AD6D6, 0x2B4BCB61, 0x350C9B64, 0x31CD86D3, 0x3C8EA00A, 0x384FBDBD,
+        0x4C11DB70, 0x48D0C6C7, 0x4593E01E, 0x4152FDA9, 0x5F15ADAC, 0x5BD4B01B, 0x569796C2, 0x52568B75,
+        0x6A1936C8, 0x6ED82B7F, 0x639B0DA6, 0x675A1011, 0x791D4014, 0x7DDC5DA3, 0x709F7B7A, 0x745E66CD,
+        0x9823B6E0, 0x9CE2AB57, 0x91A18D8E, 0x95609039, 0x8B27C03C, 0x8FE6DD8B, 0x82A5FB52, 0x8664E6E5,
+        0xBE2B5B58, 0xBAEA46EF, 0xB7A96036, 0xB3687D81, 0xAD2F2D84, 0xA9EE3033, 0xA4AD16EA, 0xA06C0B5D,
+        0xD4326D90, 0xD0F37027, 0xDDB056FE, 0xD9714B49, 0xC7361B4C, 0xC3F706FB, 0xCEB42022, 0xCA753D95,
+        0xF23A8028, 0xF6FB9D9F, 0xFBB8BB46, 0xFF79A6F1, 0xE13EF6F4, 0xE5FFEB43, 0xE8BCCD9A, 0xEC7DD02D,
+        0x34867077, 0x30476DC0, 0x3D044B19, 0x39C556AE, 0x278206AB, 0x23431B1C, 0x2E003DC5, 0x2AC12072,
+        0x128E9DCF, 0x164F8078, 0x1B0CA6A1, 0x1FCDBB16, 0x018AEB13, 0x054BF6A4, 0x0808D07D, 0x0CC9CDCA,
+        0x7897AB07, 0x7C56B6B0, 0x71159069, 0x75D48DDE, 0x6B93DDDB, 0x6F52C06C, 0x6211E6B5, 0x66D0FB02,
+        0x5E9F46BF, 0x5A5E5B08, 0x571D7DD1, 0x53DC6066, 0x4D9B3063, 0x495A2DD4, 0x44190B0D, 0x40D816BA,
+        0xACA5C697, 0xA864DB20, 0xA527FDF9, 0xA1E6E04E, 0xBFA1B04B, 0xBB60ADFC, 0xB6238B25, 0xB2E29692,
+        0x8AAD2B2F, 0x8E6C3698, 0x832F1041, 0x87EE0DF6, 0x99A95DF3, 0x9D684044, 0x902B669D, 0x94EA7B2A,
+        0xE0B41DE7, 0xE4750050, 0xE9362689, 0xEDF73B3E, 0xF3B06B3B, 0xF771768C, 0xFA325055, 0xFEF34DE2,
+        0xC6BCF05F, 0xC27DEDE8, 0xCF3ECB31, 0xCBFFD686, 0xD5B88683, 0xD1799B34, 0xDC3ABDED, 0xD8FBA05A,
+        0x690CE0EE, 0x6DCDFD59, 0x608EDB80, 0x644FC637, 0x7A089632, 0x7EC98B85, 0x738AAD5C, 0x774BB0EB,
+        0x4F040D56, 0x4BC510E1, 0x46863638, 0x42472B8F, 0x5C007B8A, 0x58C1663D, 0x558240E4, 0x51435D53,
+        0x251D3B9E, 0x21DC2629, 0x2C9F00F0, 0x285E1D47, 0x36194D42, 0x32D850F5, 0x3F9B762C, 0x3B5A6B9B,
+        0x0315D626, 0x07D4CB91, 0x0A97ED48, 0x0E56F0FF, 0x1011A0FA, 0x14D0BD4D, 0x19939B94, 0x1D528623,
+        0xF12F560E, 0xF5EE4BB9, 0xF8AD6D60, 0xFC6C70D7, 0xE22B20D2, 0xE6EA3D65, 0xEBA91BBC, 0xEF68060B,
+        0xD727BBB6, 0xD3E6A601, 0xDEA580D8, 0xDA649D6F, 0xC423CD6A, 0xC0E2D0DD, 0xCDA1F604, 0xC960EBB3,
+        0xBD3E8D7E, 0xB9FF90C9, 0xB4BCB610, 0xB07DABA7, 0xAE3AFBA2, 0xAAFBE615, 0xA7B8C0CC, 0xA379DD7B,
+        0x9B3660C6, 0x9FF77D71, 0x92B45BA8, 0x9675461F, 0x8832161A, 0x8CF30BAD, 0x81B02D74, 0x857130C3,
+        0x5D8A9099, 0x594B8D2E, 0x5408ABF7, 0x50C9B640, 0x4E8EE645, 0x4A4FFBF2, 0x470CDD2B, 0x43CDC09C,
+        0x7B827D21, 0x7F436096, 0x7200464F, 0x76C15BF8, 0x68860BFD, 0x6C47164A, 0x61043093, 0x65C52D24,
+        0x119B4BE9, 0x155A565E, 0x18197087, 0x1CD86D30, 0x029F3D35, 0x065E2082, 0x0B1D065B, 0x0FDC1BEC,
+        0x3793A651, 0x3352BBE6, 0x3E119D3F, 0x3AD08088, 0x2497D08D, 0x2056CD3A, 0x2D15EBE3, 0x29D4F654,
+        0xC5A92679, 0xC1683BCE, 0xCC2B1D17, 0xC8EA00A0, 0xD6AD50A5, 0xD26C4D12, 0xDF2F6BCB, 0xDBEE767C,
+        0xE3A1CBC1, 0xE760D676, 0xEA23F0AF, 0xEEE2ED18, 0xF0A5BD1D, 0xF464A0AA, 0xF9278673, 0xFDE69BC4,
+        0x89B8FD09, 0x8D79E0BE, 0x803AC667, 0x84FBDBD0, 0x9ABC8BD5, 0x9E7D9662, 0x933EB0BB, 0x97FFAD0C,
+        0xAFB010B1, 0xAB710D06, 0xA6322BDF, 0xA2F33668, 0xBCB4666D, 0xB8757BDA, 0xB5365D03, 0xB1F740B4,
+        ]
+
+# Hashes are computed one byte at a time, but the computation is linear, so
+# each byte's contribution to the final hash only depends on the byte itself
+# and how far it is from the end of the path.  `_position_tables[n][byte]`
+# holds those contributions for bytes `n` from the end, which lets a whole
+# path be hashed with a single lookup per byte and an XOR.  The tables are
+# only built when there's enough hashing to do that it's worthwhile (see
+# `inventory_path_hashes`), and are only ever extended, never modified.
+_position_tables = []
+_position_tables_lock = threading.Lock()
+_position_array = None
+
+# NumPy is only imported (if available) the first time we've got a batch of
+# at least this many paths to hash, since importing it is fairly slow.
+_numpy_min_batch = 256
+_numpy = None
+_numpy_checked = False
+
+class _LRUMemo(object):
+    """
+    Small thread-safe LRU cache which remembers the last `maxsize` hashes
+    we computed, for callers which hash the same paths repeatedly.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                return self.data[key]
+        return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+_path_hash_memo = _LRUMemo(4096)
+
+def inventory_path_hash(object_path):
+    """
+    Returns the hashes used in the profile for weapon customizations and the golden key
+    count.  Possibly used for other things, too.  Paths whose hashes have been
+    precomputed (see `_pathhashes.py`) are just looked up; anything else is computed
+    (and remembered, in case it's asked for again).
+    """
+    if object_path in _precomputed_path_hashes:
+        return _precomputed_path_hashes[object_path]
+    crc32 = _path_hash_memo.get(object_path)
+    if crc32 is None:
+        crc32 = _hash_encoded_path(_encode_inventory_path(object_path))
+        _path_hash_memo.put(object_path, crc32)
+    return crc32
+
+def inventory_path_hashes(object_paths):
+    """
+    Returns a list of the hashes for each of `object_paths`, as per
+    `inventory_path_hash`.  This is much quicker than calling that for each
+    path when there are a lot of paths to hash, and will use NumPy if it's
+    available.
+    """
+    hashes = [None]*len(object_paths)
+    to_compute = {}
+    for idx, object_path in enumerate(object_paths):
+        if object_path in _precomputed_path_hashes:
+            hashes[idx] = _precomputed_path_hashes[object_path]
+        else:
+            crc32 = _path_hash_memo.get(object_path)
+            if crc32 is None:
+                to_compute.setdefault(object_path, []).append(idx)
+            else:
+                hashes[idx] = crc32
+    if to_compute:
+        new_paths = list(to_compute.keys())
+        new_hashes = _hash_encoded_paths([_encode_inventory_path(p) for p in new_paths])
+        for object_path, crc32 in zip(new_paths, new_hashes):
+            _path_hash_memo.put(object_path, crc32)
+            for idx in to_compute[object_path]:
+                hashes[idx] = crc32
+    return hashes
+
+def compute_inventory_path_hash(object_path):
+    """
+    Computes the hashes used in the profile for weapon customizations and the golden key
+    count, without using any precomputed or remembered values.  Many thanks to Gibbed,
+    yet again, for this!
+    """
+    return _hash_encoded_path(_encode_inventory_path(object_path))
+
+def _encode_inventory_path(object_path):
+    """
+    Returns the bytes which actually get hashed for `object_path`
+    """
+    if '.' not in object_path:
+        object_path = '{}.{}'.format(object_path, object_path.split('/')[-1])
+
+    # TODO: Gibbed was under the impression that these were checksummed in
+    # UTF-16, but the hashes all match for me when using latin1/utf-8.
+    return object_path.upper().encode('latin1')
+
+def _hash_encoded_path(object_full):
+    """
+    Computes the hash for the encoded path `object_full`, using our position
+    tables if they've been built out far enough.
+    """
+    tables = _position_tables
+    if 0 < len(object_full) <= len(tables):
+        return functools.reduce(operator.xor,
+                map(operator.getitem, tables[len(object_full)-1::-1], object_full), 0)
+    crc32 = 0
+    for char in object_full:
+        crc32 = (_weapon_cust_crc32_table[(crc32 ^ (char >> 0)) & 0xFF] ^ (crc32 >> 8)) & 0xFFFFFFFF
+        crc32 = (_weapon_cust_crc32_table[(crc32 ^ (char >> 8)) & 0xFF] ^ (crc32 >> 8)) & 0xFFFFFFFF
+    return crc32
+
+def _hash_encoded_paths(encoded):
+    """
+    Computes the hashes for a list of encoded paths.  If there's enough
+    hashing to do, our position tables are extended to cover the longest
+    path, and NumPy is used if it's available.
+    """
+    max_len = max(map(len, encoded))
+    missing = max_len - len(_position_tables)
+    # Each new table costs about as much to build as hashing 256 bytes
+    if missing > 0 and sum(map(len, encoded)) >= missing*256:
+        _extend_position_tables(max_len)
+    if len(encoded) >= _numpy_min_batch and max_len <= len(_position_tables):
+        numpy = _get_numpy()
+        if numpy is not None:
+            return _hash_encoded_paths_numpy(numpy, encoded)
+    return [_hash_encoded_path(object_full) for object_full in encoded]
+
+def _hash_encoded_paths_numpy(numpy, encoded):
+    """
+    Computes the hashes for a list of encoded paths using NumPy.  The
+    position tables must already cover the longest path.  The contribution
+    of every byte of every path is looked up in one go, and then XORed
+    together per-path.
+    """
+    global _position_array
+    tables = _position_array
+    if tables is None or tables.shape[0] < len(_position_tables):
+        tables = numpy.array(_position_tables, dtype=numpy.uint32)
+        _position_array = tables
+    lengths = numpy.fromiter(map(len, encoded), dtype=numpy.intp, count=len(encoded))
+    data = numpy.frombuffer(b''.join(encoded), dtype=numpy.uint8)
+    ends = numpy.cumsum(lengths)
+    starts = ends - lengths
+    positions = numpy.repeat(ends-1, lengths) - numpy.arange(len(data))
+    contributions = tables[positions, data]
+    return numpy.bitwise_xor.reduceat(contributions, starts).tolist()
+
+def _extend_position_tables(length):
+    """
+    Builds out our position tables so that they cover paths of up to
+    `length` bytes.
+    """
+    global _position_tables
+    table = _weapon_cust_crc32_table
+    with _position_tables_lock:
+        tables = list(_position_tables)
+        while len(tables) < length:
+            if tables:
+                prev = tables[-1]
+            else:
+                prev = range(256)
+            # Each table is the previous one carried through one more
+            # character's worth of hashing (ie: two zero bytes); the first
+            # starts from the byte values themselves.
+            new_table = []
+            for crc32 in prev:
+                crc32 = table[crc32 & 0xFF] ^ (crc32 >> 8)
+                crc32 = table[crc32 & 0xFF] ^ (crc32 >> 8)
+                new_table.append(crc32)
+            tables.append(new_table)
+        _position_tables = tables
+
+def _get_numpy():
+    """
+    Returns the `numpy` module, or `None` if it's not available
+    """
+    global _numpy
+    global _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            pass
+        _numpy_checked = True
+    return _numpy
+
+def weapon_cust_paths_to_hash(obj_to_eng):
+    """
+    Computes the hashes used in the profile, for weapon customizations (skins+trinkets).
+    """
+    to_ret = {}
+    for (object_path, eng) in obj_to_eng.items():
+        to_ret[inventory_path_hash(object_path)] = eng
+    return to_ret
+
+# Golden Keys
+goldenkey_category = '/Game/Gear/_Shared/_Design/InventoryCategories/InventoryCategory_GoldenKey'
+goldenkey_hash = inventory_path_hash(goldenkey_category)
+
+# Vault Card #1 Keys
+vaultcard1key_category = '/Game/Gear/_Shared/_Design/InventoryCategories/InventoryCategory_VaultCard1Key'
+vaultcard1key_hash = inventory_path_hash(vaultcard1key_category)
+
+# Vault Card #2 Keys
+vaultcard2key_category = '/Game/Gear/_Shared/_Design/InventoryCategories/InventoryCategory_VaultCard2Key'
+vaultcard2key_hash = inventory_path_hash(vaultcard2key_category)
+
+# Vault Card #3 Keys
+vaultcard3key_category = '/Game/Gear/_Shared/_Design/InventoryCategories/InventoryCategory_VaultCard3Key'
+vaultcard3key_hash = inventory_path_hash(vaultcard3key_category)
+
+# Diamond Keys
+diamondkey_category = '/Game/Gear/_Shared/_Design/InventoryCategories/InventoryCategory_DiamondKey'
+diamondkey_hash = inventory_path_hash(diamondkey_category)
@@ -0,0 +1,319 @@
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+# Mission data: names, plot missions, and Takedown Discovery missions.
+
+# Takedown Discovery missions
+takedown_missions = {
+        '/Game/PatchDLC/Raid1/Missions/Mission_Raid1Intro.Mission_Raid1Intro_C': (
+            '/Game/PatchDLC/Raid1/Missions/Mission_Raid1Intro.Set_MissionEnd_ObjectiveSet',
+            [1, 0, 0, 1, 0]),
+        '/Game/PatchDLC/Takedown2/Missions/Side/Mission_Takedown2_Intro.Mission_Takedown2_Intro_C': (
+            '/Game/PatchDLC/Takedown2/Missions/Side/Mission_Takedown2_Intro.Set_MissionEnd_ObjectiveSet',
+            [1, 0, 0, 1, 0]),
+        }
+
+# Mission names
+#
+# For most missions, the following find statement will generate this list:
+#
+#    for file in $(find Game/Missions Game/PatchDLC/Dandelion/Missions Game/PatchDLC/Hibiscus/Missions Game/PatchDLC/Raid1/Missions Game/PatchDLC/BloodyHarvest/Missions Game/PatchDLC/CitizenScience/Missions Game/PatchDLC/Event2/Missions Game/PatchDLC/Takedown2/Missions Game/PatchDLC/Geranium/Missions Game/PatchDLC/Alisma/Missions Game/PatchDLC/Ixora/Missions Game/PatchDLC/Ixora2/Missions \( -iname "Mission_*.uexp" -o -name "SideMission_*.uexp" -o -name "EP*_DLC2.uexp" -o -name "ALI_EP*.uexp" -o -name "ALI_SM_*.uexp" \) -print); do echo -n "'/$(dirname $file)/$(basename $file .uexp)': \""; echo $(strings $file | head -n 2 | tail -n 1)\",; done
+#
+# Various plot missions, though, from both the main game and DLC1, will need
+# some edits by hand (they use a UIName_*_MissionTitle object instead.)  Also,
+# the Rare Spawn missions need the second string, not the first, so you'll
+# want to run this to grab those:
+#
+#    for file in $(find Game/Missions/Side/RareSpawn Game/PatchDLC/Hibiscus/Missions/Side/RareSpawn -iname "Mission_*.uexp" -print); do echo -n "'/$(dirname $file)/$(basename $file .uexp)': \""; echo $(strings $file | head -n 4 | tail -n 1)\",; done
+#    
+# Keep in mind that the El Dragon Jr one will need a hand edit, since `strings`
+# only matches on latin1 by default (at least on the GNU/Linux version).
+mission_to_name = {
+        '/Game/Missions/Plot/Mission_Ep01_ChildrenOfTheVault': "Children of the Vault",
+        '/Game/Missions/Plot/Mission_Ep02_Sacrifice': "From the Ground Up",
+        '/Game/Missions/Plot/Mission_Ep03_GetVaultMap': "Cult Following",
+        '/Game/Missions/Plot/Mission_Ep04_EarnSpaceship': "Taking Flight",
+        '/Game/Missions/Plot/Mission_Ep05_OvercomeHQBlockade': "Hostile Takeover",
+        '/Game/Missions/Plot/Mission_Ep05_Sanctuary': "Sanctuary",
+        '/Game/Missions/Plot/Mission_Ep06_MeetMaya': "The Impending Storm",
+        '/Game/Missions/Plot/Mission_Ep08_OrbitalPlatform': "Space-Laser Tag",
+        '/Game/Missions/Plot/MIssion_Ep09_AtlasHQ': "Atlas, At Last",
+        '/Game/Missions/Plot/Mission_Ep10_CityVault': "Beneath the Meridian",
+        '/Game/Missions/Plot/Mission_Ep11_PrisonBreak': "Hammerlocked",
+        '/Game/Missions/Plot/Mission_Ep12_GrandTour': "Lair of the Harpy",
+        '/Game/Missions/Plot/Mission_Ep13_JakobsRebellion': "The Guns of Reliance",
+        '/Game/Missions/Plot/Mission_Ep13_Watership': "The Family Jewel",
+        '/Game/Missions/Plot/Mission_Ep15_MarshFields': "Going Rogue",
+        '/Game/Missions/Plot/Mission_Ep16_DesertVault': "The Great Vault",
+        '/Game/Missions/Plot/Mission_Ep16_SiblingRivalry': "Cold as the Grave",
+        '/Game/Missions/Plot/Mission_Ep17_BigChase': "Blood Drive",
+        '/Game/Missions/Plot/Mission_Ep19_MinerDetails': "Angels and Speed Demons",
+        '/Game/Missions/Plot/Mission_Ep20_FirstVaultHunter': "The First Vault Hunter",
+        '/Game/Missions/Plot/Mission_Ep21_Beachhead': "Footsteps of Giants",
+        '/Game/Missions/Plot/Mission_Ep22_TheMachine': "In the Shadow of Starlight",
+        '/Game/Missions/Plot/Mission_Ep23_TyreenFinalBoss': "Divine Retribution",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds1/Mission_ProvingGrounds_Mission01': "Trial of Survival",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds1/Mission_ProvingGroundsDiscovery_Mission01': "Discover the Trial of Survival",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds4/Mission_ProvingGrounds_Mission04': "Trial of Fervor",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds4/Mission_ProvingGroundsDiscovery_Mission04': "Discover the Trial of Fervor",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds5/Mission_ProvingGrounds_Mission05': "Trial of Cunning",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds5/Mission_ProvingGroundsDiscovery_Mission05': "Discover the Trial of Cunning",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds6/Mission_ProvingGrounds_Mission06': "Trial of Supremacy",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds6/Mission_ProvingGroundsDiscovery_Mission06': "Discover the Trial of Supremacy",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds7/Mission_ProvingGrounds_Mission07': "Trial of Discipline",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds7/Mission_ProvingGroundsDiscovery_Mission07': "Discover the Trial of Discipline",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds8/Mission_ProvingGrounds_Mission08': "Trial of Instinct",
+        '/Game/Missions/Side/ProvingGrounds/ProvingGrounds8/Mission_ProvingGroundsDiscovery_Mission08': "Discover the Trial of Instinct",
+        '/Game/Missions/Side/Raid/Raid/Mission_RaidOnMaliwan': "Raid On Maliwan",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_BormanNates': "Kill Borman Nates",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_CaptainThunkAndSloth': "Kill Captain Thunk and Sloth",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_DemoSkag': "Kill Demoskaggon",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_Dinklebot': "Kill Dinklebot",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_ElDragonJr': "Kill El Dragón Jr",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_EnforcerUrist': "Kill Urist McEnforcer",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_IndoTyrant': "Kill IndoTyrant",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_Maxitrillion': "Kill Maxitrillion",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_PowerTroopers': "Kill the Power Troopers",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_Rakkman': "Kill Rakkman",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_RedJabber': "Kill Red Jabber",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_RoadDog': "Kill Road Dog",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_Tarantella': "Kill Tarantella",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_TheUnstoppable': "Kill The Unstoppable",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_ThreeDragons': "Kill the Grogans and Their Mother",
+        '/Game/Missions/Side/RareSpawn/Mission_Async_VicAndWarty': "Kill Wick and Warty",
+        '/Game/Missions/Side/Sanctuary3/Mission_Infestation': "The Kevin Konundrum",
+        '/Game/Missions/Side/Sanctuary3/Mission_JustAPrick': "Just A Prick",
+        '/Game/Missions/Side/Slaughters/CoVSlaughter/Mission_COVSlaughter1': "The Slaughter Shaft",
+        '/Game/Missions/Side/Slaughters/CreatureSlaughter/Mission_CreatureSlaughter': "Cistern of Slaughter",
+        '/Game/Missions/Side/Slaughters/TechSlaughter/Mission_TechSlaughter1': "Tech Slaughter",
+        '/Game/Missions/Side/Slaughters/TechSlaughter/Mission_TechSlaughterDiscovery': "Welcome to Slaughterstar 3000",
+        '/Game/Missions/Side/Zone_0/Prologue/Mission_BadReception': "Bad Reception",
+        '/Game/Missions/Side/Zone_0/Prologue/Mission_FineDining': "Skag Dog Days",
+        '/Game/Missions/Side/Zone_0/Prologue/Mission_Scoopers_Bully': "Dump on Dumptruck",
+        '/Game/Missions/Side/Zone_0/Prologue/Mission_UnderwearTink': "Under Taker",
+        '/Game/Missions/Side/Zone_0/Prologue/Mission_VendingMachineRepair': "Powerful Connections",
+        '/Game/Missions/Side/Zone_0/Sacrifice/Mission_GoldenCalves': "Golden Calves",
+        '/Game/Missions/Side/Zone_0/Sacrifice/Mission_HeadCase': "Head Case",
+        '/Game/Missions/Side/Zone_0/Sacrifice/Mission_PandorasNextTopMouthpiece': "Pandora's Next Top Mouthpiece",
+        '/Game/Missions/Side/Zone_1/Athenas/Mission_InvasionOfPrivacy': "Invasion of Privacy",
+        '/Game/Missions/Side/Zone_1/Athenas/Mission_MonkMission': "Holy Spirits",
+        '/Game/Missions/Side/Zone_1/AtlasHQ/Mission_RatchetItUp': "Ratch'd Up",
+        '/Game/Missions/Side/Zone_1/City/Mission_BitterPillToSwallow': "Healers and Dealers",
+        '/Game/Missions/Side/Zone_1/City/Mission_DynastyDiner': "Dynasty Diner",
+        '/Game/Missions/Side/Zone_1/City/Mission_PissingContest': "Maliwannabees",
+        '/Game/Missions/Side/Zone_1/City/Mission_RiseAndGrind': "Rise and Grind",
+        '/Game/Missions/Side/Zone_1/City/Mission_WizardOfNogs': "Technical NOGout",
+        '/Game/Missions/Side/Zone_1/OrbitalPlatform/OppositionResearch/Mission_OppResearch': "Opposition Research",
+        '/Game/Missions/Side/Zone_1/Towers/Mission_KillKillavolt': "Kill Killavolt",
+        '/Game/Missions/Side/Zone_1/Towers/Mission_LastKatagawa': "Proof of Wife",
+        '/Game/Missions/Side/Zone_1/Towers/Mission_Porta-Prison': "Porta Prison",
+        '/Game/Missions/Side/Zone_2/Mansion/Mission_AureliasSkeletons': "Sacked",
+        '/Game/Missions/Side/Zone_2/Mansion/Mission_WitchesBrew': "Witch's Brew",
+        '/Game/Missions/Side/Zone_2/MarshFields/Mission_RockOnPandora': "Raiders of the Lost Rock",
+        '/Game/Missions/Side/Zone_2/MarshFields/Mission_SuckerPunch': "Sell Out",
+        '/Game/Missions/Side/Zone_2/Prison/Mission_FreeHugs': "On the Blood Path",
+        '/Game/Missions/Side/Zone_2/Prison/Mission_MalevolentPractice': "Malevolent Practice",
+        '/Game/Missions/Side/Zone_2/Watership/Mission_RumbleJungle': "Rumble In The Jungle",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_DriveAwayThePain': "Get Quick, Slick",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_DudeBro': "Swamp Bro",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_DynastyDash_Wetlands': "Dynasty Dash: Eden-6",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_DynastyDash_Wetlands_Repeatable': "Dynasty Dash: Floodmoor Basin",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_SpecialDelivery': "Capture the Frag",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_TheHangover': "Irregular Customers",
+        '/Game/Missions/Side/Zone_2/Wetlands/Mission_TortureTruck': "Don't Truck with Eden-6",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_BabyDancer': "Baby Dancer",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_BirthdaySurprise': "Life of the Party",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_BuffFilmBuff': "Buff Film Buff",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_CaringForElderly': "The Feeble and the Furious",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_ChangeOfHeart': "Sheega's All That",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_DynastyDash_Desert': "Dynasty Dash: Pandora",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_DynastyDash_Desert_Repeatable': "Dynasty Dash: Devil's Razor",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_EchoNetNeutrality': "ECHOnet Neutrality",
+        '/Game/Missions/Side/Zone_3/Desert/Mission_ItsComplicated': "Boom Boom Boomtown",
+        '/Game/Missions/Side/Zone_3/Mine/Mission_BridgeInTheDark': "The Demon in the Dark",
+        '/Game/Missions/Side/Zone_3/Mine/Mission_GrowingPains': "Childhood's End",
+        '/Game/Missions/Side/Zone_3/Mine/Mission_WildlifeConservation': "Wildlife Conservation",
+        '/Game/Missions/Side/Zone_3/Motorcade/Mission_Gameshow': "Let's Get It Vaughn",
+        '/Game/Missions/Side/Zone_3/Motorcade/Mission_Homestead_Part1': "The Homestead",
+        '/Game/Missions/Side/Zone_3/Motorcade/Mission_Homestead_Part2': "The Homestead (Part 2)",
+        '/Game/Missions/Side/Zone_3/Motorcade/Mission_Homestead_Part3': "The Homestead (Part 3)",
+        '/Game/Missions/Side/Zone_3/Motorcade/Mission_Just_Desserts': "Just Desserts",
+        '/Game/Missions/Side/Zone_4/Desolate/Mission_BetterTimes': "Fire in the Sky",
+        '/Game/Missions/Side/Zone_4/Desolate/Mission_BoneDeep': "Bad Vibrations",
+        '/Game/Missions/Side/Zone_4/Desolate/Mission_Canonization': "Cannonization",
+        '/Game/Missions/Side/Zone_4/Desolate/Mission_DestroyerOfWorlds': "Transaction-Packed",
+        '/Game/Missions/Side/Zone_4/Desolate/Mission_Homeopathological': "Homeopathological",
+        '/Game/Missions/Side/Zone_4/Desolate/Mission_ItsAlive2': "It's Alive",
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP01': "Enter the Psychoscape",
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP02': "Siege of Castle Crimson",
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP03': "What Love Remains",
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP04': "Inhuman Trials",
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP05': "Locus of Rage",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_AllShapesAndCalibers': "A Good Egg",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_BlastRequests': "Blast Requests",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_ChecksAndBalances': "Check, Please",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_ExposureTherapy': "Remodel Behavior",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_GoodbyeOldFriend': "Laid to Rust",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_HotNBothered': "Hot and Unbothered",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_InkBlots': "Don't Call it a Rorschach",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_ParadeHarpoon': "Krieg's on Parade",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_ShadesOfTruth': "It's an Allegory",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_SpineTingler': "Scratch, Don't Sniff",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_StrongBones': "Does a Body Good",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_ThatRingsABell': "That Rings a Something",
+        '/Game/PatchDLC/Alisma/Missions/Side/ALI_SM_WhenItRains': "Brainstorm",
+        '/Game/PatchDLC/BloodyHarvest/Missions/Side/Seasonal/Mission_Season_01_Intro': "Bloody Harvest: Descent into Heck",
+        '/Game/PatchDLC/BloodyHarvest/Missions/Side/Seasonal/Mission_Season_01_Repeatable': "Bloody Harvest: The Rebloodening",
+        '/Game/PatchDLC/CitizenScience/Missions/Mission_CitizenScience_Intro': "Borderlands Science!",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep01_MeetTimothy': "The Handsome Jackpot",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep02_MeetCrad': "Playing with Fire",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep03_Impound': "Winners and Losers",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep04_Trashtown': "One Man's Treasure",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep05_ThePlan': "The Plan",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep06_TheCore': "Jack's Wild",
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep07_TheHeist': "All Bets Off",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_AcidTrip': "Acid Trip",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_BrotherlyLove': "Sisterly Love",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_DoItForDigby_Part1': "Do it for Digby - Part 1",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_DoItForDigby_Part2': "Do it for Digby - Part 2",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_DoItForDigby_Part3': "Do it for Digby - Part 3",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_DoubleDown': "Double Down",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_GreatEscape': "The Great Escape",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_HeartOfGold': "Heart of Gold",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_RagingBot': "Raging Bot",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_RegainingOnesFeet': "Regaining One's Feet",
+        '/Game/PatchDLC/Dandelion/Missions/Side/Mission_DLC1_Side_TooMuchOfAGoodThing': "Too Much Of A Good Thing",
+        '/Game/PatchDLC/Event2/Missions/Side/MauriceSide/Mission_Maurice': "Claw and Order",
+        '/Game/PatchDLC/Event2/Missions/Side/Seasonal/Mission_Season_02_Intro': "Revenge of the Cartels: Ultraviolet Nights",
+        '/Game/PatchDLC/Event2/Missions/Side/Seasonal/Mission_Season_02_Repeatable': "Revenge of the Cartels II: The Revengening",
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep01_WestlandWelcome': "Blood From A Stone",
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep02_Bathhouse': "The Name of the Law",
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep03_ObsidianForest': "Off the Rails",
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep04_Facility': "Where It All Started",
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep05_Crater': "Riding to Ruin",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_AnimalControl': "Lost and Found",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_BloodAndBeans': "Of Blood and Beans",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_DirtyDeeds': "Dirty Deeds",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_Dueling': "The Quick and the Quickerer",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_GhostStories': "The Meatman Prophecy",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_LoveBarsNone': "The Dandy and Damsel",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_MoneyBackGuarantee': "Money Back Guarantee",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_RustlerBaby': "Devil Rustlers",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_SaurdewValley': "Saurdew Valley",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_SnakeOil': "Miracle Elixir Fixer",
+        '/Game/PatchDLC/Geranium/Missions/Side/Mission_TheLegendOfMcSmugger': "The Legend of McSmugger",
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP01_DLC2': "The Party Out of Space",
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP02_DLC2': "The Shadow Over Cursehaven",
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP03_DLC2': "The Case of Wainwright Jakobs",
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP04_DLC2': "The Horror in the Woods",
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP05_DLC2': "On the Mountain of Mayhem",
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP06_DLC2': "The Call of Gythian",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/RareSpawn/Mission_Async_FrostbiteDragon': "Kill Shiverous the Unscathed",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/RareSpawn/Mission_Async_MushroomGiant': "Kill Fungal Gorger",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/RareSpawn/Mission_Async_Shocker': "Kill Voltborn",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/RareSpawn/Mission_Async_ZealotPilfer': "Kill Amach",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_Bounty_BusinessAsUsual': "The Proprietor: Rare Vintage",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_Bounty_DebtCollector': "The Proprietor: Empty Bottles",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_HappilyEverAfter': "Happily Ever After",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_IntoTheDeep': "The Madness Beneath",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_Necrocookmicon': "The Nibblenomicon",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_PrivateEyePart1': "Cold Case: Buried Questions",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_PrivateEyePart2': "Cold Case: Restless Memories",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_PrivateEyePart3': "Cold Case: Forgotten Answers",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_ReturnOfMaxSky': "The Great Escape (Part 2)",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_SinisterSounds': "Sinister Sounds",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_WeSlassPart1': "We Slass!",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_WeSlassPart2': "We Slass! (Part 2)",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_WeSlassPart3': "We Slass! (Part 3)",
+        '/Game/PatchDLC/Hibiscus/Missions/Side/SideMission_DLC2_WhereIBelong': "Call of the Deep",
+        '/Game/PatchDLC/Ixora/Missions/Side/Mission_GearUp': "Arms Race",
+        '/Game/PatchDLC/Ixora/Missions/Side/Mission_GearUp_Intro': "Arms Race: Introduction",
+        '/Game/PatchDLC/Ixora2/Missions/Side/Mission_Ixora_Main01': "Mysteriouslier: Murder on Eschaton Row",
+        '/Game/PatchDLC/Ixora2/Missions/Side/Mission_Ixora_Main02': "Mysteriouslier: The Vanishing of Hizzen Mays",
+        '/Game/PatchDLC/Ixora2/Missions/Side/Mission_Ixora_Main03': "Mysteriouslier: Ghosts of Karass Canyon",
+        '/Game/PatchDLC/Ixora2/Missions/Side/Mission_Ixora_Main04': "Mysteriouslier: Horror at Scryer's Crypt",
+        '/Game/PatchDLC/Ixora2/Missions/Side/Mission_Ixora_VarkidBoss': "You. Will. Die. (Over and Over.)",
+        '/Game/PatchDLC/Raid1/Missions/Mission_Raid1': "Takedown at the Maliwan Blacksite",
+        '/Game/PatchDLC/Raid1/Missions/Mission_Raid1Intro': "Discovery: Takedown at the Maliwan Blacksite",
+        '/Game/PatchDLC/Takedown2/Missions/Side/Mission_Takedown2': "Takedown at the Guardian Breach",
+        '/Game/PatchDLC/Takedown2/Missions/Side/Mission_Takedown2_Intro': "Discovery: Takedown at the Guardian Breach",
+        }
+for k, v in list(mission_to_name.items()):
+    lower = k.lower()
+    last_bit = lower.split('/')[-1]
+    new_k = '{}.{}_c'.format(lower, last_bit)
+    mission_to_name[new_k] = v
+
+# Plot missions (of the sort that we don't want to allow removing, since you'd
+# probably be locked out of the plot missions).  These were just copy+pasted
+# from the mission_to_name structure above and pruned manually.
+plot_missions = set()
+for mission_name in [
+        '/Game/Missions/Plot/Mission_Ep01_ChildrenOfTheVault',
+        '/Game/Missions/Plot/Mission_Ep02_Sacrifice',
+        '/Game/Missions/Plot/Mission_Ep03_GetVaultMap',
+        '/Game/Missions/Plot/Mission_Ep04_EarnSpaceship',
+        '/Game/Missions/Plot/Mission_Ep05_OvercomeHQBlockade',
+        '/Game/Missions/Plot/Mission_Ep05_Sanctuary',
+        '/Game/Missions/Plot/Mission_Ep06_MeetMaya',
+        '/Game/Missions/Plot/Mission_Ep08_OrbitalPlatform',
+        '/Game/Missions/Plot/MIssion_Ep09_AtlasHQ',
+        '/Game/Missions/Plot/Mission_Ep10_CityVault',
+        '/Game/Missions/Plot/Mission_Ep11_PrisonBreak',
+        '/Game/Missions/Plot/Mission_Ep12_GrandTour',
+        '/Game/Missions/Plot/Mission_Ep13_JakobsRebellion',
+        '/Game/Missions/Plot/Mission_Ep13_Watership',
+        '/Game/Missions/Plot/Mission_Ep15_MarshFields',
+        '/Game/Missions/Plot/Mission_Ep16_DesertVault',
+        '/Game/Missions/Plot/Mission_Ep16_SiblingRivalry',
+        '/Game/Missions/Plot/Mission_Ep17_BigChase',
+        '/Game/Missions/Plot/Mission_Ep19_MinerDetails',
+        '/Game/Missions/Plot/Mission_Ep20_FirstVaultHunter',
+        '/Game/Missions/Plot/Mission_Ep21_Beachhead',
+        '/Game/Missions/Plot/Mission_Ep22_TheMachine',
+        '/Game/Missions/Plot/Mission_Ep23_TyreenFinalBoss',
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP01',
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP02',
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP03',
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP04',
+        '/Game/PatchDLC/Alisma/Missions/Plot/ALI_EP05',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep01_MeetTimothy',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep02_MeetCrad',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep03_Impound',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep04_Trashtown',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep05_ThePlan',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep06_TheCore',
+        '/Game/PatchDLC/Dandelion/Missions/Plot/Mission_DLC1_Ep07_TheHeist',
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep01_WestlandWelcome',
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep02_Bathhouse',
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep03_ObsidianForest',
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep04_Facility',
+        '/Game/PatchDLC/Geranium/Missions/Plot/Mission_Ep05_Crater',
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP01_DLC2',
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP02_DLC2',
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP03_DLC2',
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP04_DLC2',
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP05_DLC2',
+        '/Game/PatchDLC/Hibiscus/Missions/Plot/EP06_DLC2',
+        ]:
+    lower = mission_name.lower()
+    last_bit = lower.split('/')[-1]
+    plot_missions.add('{}.{}_c'.format(lower, last_bit))
@@ -29,10 +29,21 @@
 # "gvas-converter" project: https://github.com/13xforever/gvas-converter
 
 import base64
+import copy
 import struct
 import google.protobuf
-import google.protobuf.json_format
-from . import *
+from . import (
+        borderlands_science_levels, diamondkey_hash, goldenkey_hash,
+        guardian_rank_rewards, profile_echothemes, profile_echothemes_defaults,
+        profile_emotes, profile_emotes_defaults, profile_heads,
+        profile_heads_defaults, profile_roomdeco_eng_to_obj,
+        profile_roomdeco_obj_to_eng, profile_skins, profile_skins_defaults,
+        profile_weaponskins_eng_to_hash, profile_weaponskins_hash_to_eng,
+        profile_weaponskins_obj_to_eng, profile_weapontrinkets_eng_to_hash,
+        profile_weapontrinkets_hash_to_eng, profile_weapontrinkets_obj_to_eng,
+        psdu_to_eng, psdu_to_max, psdu_to_psduobj, psduobj_to_psdu,
+        vaultcard1key_hash, vaultcard2key_hash, vaultcard3key_hash,
+        )
 from . import datalib
 from . import OakProfile_pb2, OakShared_pb2
 
@@ -42,6 +53,8 @@ class BL3ProfItem(datalib.BL3Serial):
     just so we can keep track of what index it is in the profile.
     """
 
+    __slots__ = ('container', 'index')
+
     def __init__(self, serial_number, container, index, datawrapper):
         self.container = container
         self.index = index
@@ -72,6 +85,10 @@ class BL3Profile(object):
 
     https://gist.github.com/gibbed/b6a93f74c575ce99b42c3b629ac1856a
 
+    Item data is looked up via the process-wide `DataWrapper` from
+    `datalib.get_shared_datawrapper`, unless a specific `datawrapper` is
+    passed in.
+
     All these getters/setters are rather un-Pythonic; should be using
     some decorations for that instead.  Alas!
     """
@@ -90,9 +107,35 @@ class BL3Profile(object):
         0x7D, 0x51, 0xB0, 0x1E, 0xBE, 0xD0, 0x77, 0x43,
         ])
 
-    def __init__(self, filename, debug=False):
+    # Header info which gets cached along with the parsed protobufs when
+    # `datalib.FileCache` is in use
+    _header_attrs = ('sg_version', 'pkg_version', 'engine_major', 'engine_minor',
+            'engine_patch', 'engine_build', 'build_id', 'fmt_version',
+            'custom_format_data', 'sg_type')
+
+    def __init__(self, filename, debug=False, datawrapper=None):
         self.filename = filename
-        self.datawrapper = datalib.DataWrapper()
+        if datawrapper is None:
+            self.datawrapper = datalib.get_shared_datawrapper()
+        else:
+            self.datawrapper = datawrapper
+
+        # If we're running in batch mode, we may have already read this file.
+        # The cached protobufs are copied, since we may end up changing ours.
+        file_cache = datalib.get_file_cache()
+        if file_cache is not None and not debug:
+            cache_key = file_cache.get_key(filename)
+            cached = file_cache.get(cache_key)
+            if cached is not None:
+                (header, message) = cached
+                for attr, value in header.items():
+                    setattr(self, attr, copy.copy(value))
+                self.prof = OakProfile_pb2.Profile()
+                self.prof.CopyFrom(message)
+                return
+        else:
+            cache_key = None
+
         with open(filename, 'rb') as df:
 
             header = df.read(4)
@@ -155,6 +198,14 @@ class BL3Profile(object):
             # Parse protobufs
             self.import_protobuf(data)
 
+            # Keep a pristine copy around, if we're caching
+            if cache_key is not None:
+                message = OakProfile_pb2.Profile()
+                message.CopyFrom(self.prof)
+                file_cache.put(cache_key,
+                        {attr: copy.copy(getattr(self, attr)) for attr in self._header_attrs},
+                        message)
+
     def import_protobuf(self, data):
         """
         Given raw protobuf data, load it into ourselves so
@@ -175,6 +226,8 @@ class BL3Profile(object):
         that we can work with it.  This also sets up a few convenience vars
         for our later use
         """
+        # JSON support is fairly slow to import, and most runs don't need it
+        import google.protobuf.json_format
         message = google.protobuf.json_format.Parse(json_str, OakProfile_pb2.Profile())
         self.import_protobuf(message.SerializeToString())
 
@@ -182,6 +235,7 @@ class BL3Profile(object):
         """
         Saves ourselves to a new filename
         """
+        datalib.discard_cached_file(filename)
         with open(filename, 'wb') as df:
 
             # Header info
@@ -220,6 +274,7 @@ class BL3Profile(object):
         """
         Saves the raw protobufs to the specified filename
         """
+        datalib.discard_cached_file(filename)
         with open(filename, 'wb') as df:
             df.write(self.prof.SerializeToString())
 
@@ -227,6 +282,8 @@ class BL3Profile(object):
         """
         Saves a JSON version of our protobuf to the specfied filename
         """
+        import google.protobuf.json_format
+        datalib.discard_cached_file(filename)
         with open(filename, 'w') as df:
             df.write(google.protobuf.json_format.MessageToJson(self.prof,
                 including_default_value_fields=True,
@@ -583,6 +640,25 @@ class BL3Profile(object):
         else:
             return self.get_cur_weapon_customizations(profile_weapontrinkets_hash_to_eng)
 
+    def get_unknown_weapon_customizations(self, resolve=False):
+        """
+        Returns a set of the unlocked weapon customization hashes which aren't
+        known weapon skins or trinkets (such as ones added by game updates which
+        we don't know about yet).  If `resolve` is `True`, returns a dict instead,
+        mapping each hash to the object path it came from (if it can be found
+        via `datalib.PathHashIndex`), or `None`.
+        """
+        to_ret = set()
+        for cust in self.prof.unlocked_inventory_customization_parts:
+            cust_hash = cust.customization_part_hash
+            if cust_hash not in profile_weaponskins_hash_to_eng \
+                    and cust_hash not in profile_weapontrinkets_hash_to_eng:
+                to_ret.add(cust_hash)
+        if resolve:
+            return {h: self.datawrapper.path_hash_index.get(h) for h in to_ret}
+        else:
+            return to_ret
+
     def unlock_weapon_trinkets(self):
         """
         Unlocks all weapon trinkets
@@ -29,10 +29,22 @@
 # "gvas-converter" project: https://github.com/13xforever/gvas-converter
 
 import uuid
+import copy
 import struct
 import google.protobuf
-import google.protobuf.json_format
-from . import *
+# The larger data structures (maps, missions, vehicles) are imported by the
+# methods which use them, so that they're only loaded if they're needed.
+from . import (
+        ARTIFACT, BEASTMASTER, CHAL_ARTIFACT, COM, COM_BEASTMASTER, COM_GUNNER,
+        COM_OPERATIVE, COM_SIREN, ERIDIUM, GUNNER, MONEY, OPERATIVE, SIREN,
+        ammo_to_eng, ammo_to_max, ammoobj_to_ammo, challenge_char_lock,
+        challenge_to_challengeobj, challenge_to_eng, challengeobj_to_challenge,
+        class_to_eng, classobj_to_class, cube_puzzle_stat, curhash_to_currency,
+        currency_to_curhash, level_challenges, level_stat, max_level,
+        max_supported_level, pet_to_eng, petkey_to_pet, required_xp_list,
+        sdu_to_eng, sdu_to_max, sdu_to_sduobj, sduobj_to_sdu, slot_to_eng,
+        slotobj_to_slot,
+        )
 from . import datalib
 from . import OakSave_pb2, OakShared_pb2
 
@@ -50,6 +62,8 @@ class BL3Item(datalib.BL3Serial):
     things like money and ammo).
     """
 
+    __slots__ = ('protobuf',)
+
     def __init__(self, protobuf, datawrapper):
         self.protobuf = protobuf
         super().__init__(self.protobuf.item_serial_number, datawrapper)
@@ -152,6 +166,10 @@ class BL3Save(object):
 
     https://twitter.com/gibbed/status/1246863435868049410?s=19
 
+    Item data is looked up via the process-wide `DataWrapper` from
+    `datalib.get_shared_datawrapper`, unless a specific `datawrapper` is
+    passed in.
+
     All these getters/setters are rather un-Pythonic; should be using
     some decorations for that instead.  Alas!
     """
@@ -170,9 +188,41 @@ class BL3Save(object):
         0xCD, 0xD8, 0xB1, 0xCC, 0xA1, 0x33, 0xF9, 0xB6,
         ])
 
-    def __init__(self, filename, debug=False):
+    # Header info which gets cached along with the parsed protobufs when
+    # `datalib.FileCache` is in use
+    _header_attrs = ('sg_version', 'pkg_version', 'engine_major', 'engine_minor',
+            'engine_patch', 'engine_build', 'build_id', 'fmt_version',
+            'custom_format_data', 'sg_type')
+
+    # Challenge path prefixes for the seasonal events
+    _event_bloody_harvest_prefix = '/Game/PatchDLC/BloodyHarvest/'
+    _event_broken_hearts_prefix = '/Game/PatchDLC/EventVDay/'
+    _event_cartels_prefix = '/Game/PatchDLC/Event2/'
+
+    def __init__(self, filename, debug=False, datawrapper=None):
         self.filename = filename
-        self.datawrapper = datalib.DataWrapper()
+        if datawrapper is None:
+            self.datawrapper = datalib.get_shared_datawrapper()
+        else:
+            self.datawrapper = datawrapper
+
+        # If we're running in batch mode, we may have already read this file.
+        # The cached protobufs are copied, since we may end up changing ours.
+        file_cache = datalib.get_file_cache()
+        if file_cache is not None and not debug:
+            cache_key = file_cache.get_key(filename)
+            cached = file_cache.get(cache_key)
+            if cached is not None:
+                (header, message) = cached
+                for attr, value in header.items():
+                    setattr(self, attr, copy.copy(value))
+                self.save = OakSave_pb2.Character()
+                self.save.CopyFrom(message)
+                self._process_protobuf()
+                return
+        else:
+            cache_key = None
+
         with open(filename, 'rb') as df:
 
             header = df.read(4)
@@ -235,6 +285,14 @@ class BL3Save(object):
             # Parse protobufs
             self.import_protobuf(data)
 
+            # Keep a pristine copy around, if we're caching
+            if cache_key is not None:
+                message = OakSave_pb2.Character()
+                message.CopyFrom(self.save)
+                file_cache.put(cache_key,
+                        {attr: copy.copy(getattr(self, attr)) for attr in self._header_attrs},
+                        message)
+
     def import_protobuf(self, data):
         """
         Given raw protobuf data, load it into ourselves so
@@ -259,6 +317,13 @@ class BL3Save(object):
         # otherwise switched to v3.
         #assert(len(data) == self.save.ByteSize())
 
+        self._process_protobuf()
+
+    def _process_protobuf(self):
+        """
+        Sets up our convenience vars for the protobuf data in `self.save`
+        """
+
         # Do some data processing so that we can wrap things APIwise
         # First: Items
         self.items = [BL3Item(i, self.datawrapper) for i in self.save.inventory_items]
@@ -270,12 +335,17 @@ class BL3Save(object):
             slot = slotobj_to_slot[equip.get_obj_name()]
             self.equipslots[slot] = equip
 
+        # Challenges get looked up by path as-needed (see `_get_challenge_index`)
+        self._challenge_index = None
+
     def import_json(self, json_str):
         """
         Given JSON data, convert to protobuf and load it into ourselves so
         that we can work with it.  This also sets up a few convenience vars
         for our later use
         """
+        # JSON support is fairly slow to import, and most runs don't need it
+        import google.protobuf.json_format
         message = google.protobuf.json_format.Parse(json_str, OakSave_pb2.Character())
         self.import_protobuf(message.SerializeToString())
 
@@ -283,6 +353,7 @@ class BL3Save(object):
         """
         Saves ourselves to a new filename
         """
+        datalib.discard_cached_file(filename)
         with open(filename, 'wb') as df:
 
             # Header info
@@ -321,6 +392,7 @@ class BL3Save(object):
         """
         Saves the raw protobufs to the specified filename
         """
+        datalib.discard_cached_file(filename)
         with open(filename, 'wb') as df:
             df.write(self.save.SerializeToString())
 
@@ -328,6 +400,8 @@ class BL3Save(object):
         """
         Saves a JSON version of our protobuf to the specfied filename
         """
+        import google.protobuf.json_format
+        datalib.discard_cached_file(filename)
         with open(filename, 'w') as df:
             df.write(google.protobuf.json_format.MessageToJson(self.save,
                 including_default_value_fields=True,
@@ -688,6 +762,7 @@ class BL3Save(object):
         Maps will be their in-game IDs by default, or English names if `eng`
         is `True`
         """
+        from . import fts_to_map, map_to_eng
         # TODO: should maybe handle these edge cases better?
         maps = []
         for station in self.get_pt_last_stations():
@@ -802,6 +877,7 @@ class BL3Save(object):
         Playthrough.  Missions will be in their object name by default, or
         their English names if `eng` is `True`.
         """
+        from . import mission_to_name
         to_ret = []
         for pt in self.save.mission_playthroughs_data:
             active_missions = []
@@ -1296,10 +1372,13 @@ class BL3Save(object):
         type key will be a constant by default, or an English label if `eng` is `True`
         """
         to_ret = {}
+        char_class = None
         for chal in self.save.challenge_data:
             if chal.challenge_class_path in challengeobj_to_challenge:
                 chal_type = challengeobj_to_challenge[chal.challenge_class_path]
-                if chal_type not in challenge_char_lock or challenge_char_lock[chal_type] == self.get_class():
+                if chal_type in challenge_char_lock and char_class is None:
+                    char_class = self.get_class()
+                if chal_type not in challenge_char_lock or challenge_char_lock[chal_type] == char_class:
                     if eng:
                         chal_type = challenge_to_eng[chal_type]
                     to_ret[chal_type] = chal.currently_completed
@@ -1331,6 +1410,21 @@ class BL3Save(object):
             stat_path=stat_obj,
             ))
 
+    def _get_challenge_index(self):
+        """
+        Returns a dict mapping challenge class paths to their entries in
+        `challenge_data`, building it the first time it's needed.  If a path
+        somehow appears more than once, the first entry wins, as it would when
+        scanning the list.  Anything which adds or removes challenges should
+        reset `self._challenge_index` to `None`.
+        """
+        if self._challenge_index is None:
+            index = {}
+            for chal in self.save.challenge_data:
+                index.setdefault(chal.challenge_class_path, chal)
+            self._challenge_index = index
+        return self._challenge_index
+
     def unlock_challenge_obj(self, challenge_obj, completed_count=1, progress_level=0):
         """
         Unlock the given challenge object.  Not sure what `progress_level`
@@ -1339,14 +1433,14 @@ class BL3Save(object):
         primarily concerned with here will just have 1 for it, though.
         """
         # First look for existing objects (should always be here, I think)
-        for chal in self.save.challenge_data:
-            if chal.challenge_class_path == challenge_obj:
-                chal.currently_completed = True
-                chal.is_active = False
-                chal.completed_count = completed_count
-                chal.progress_counter = 0
-                chal.completed_progress_level = progress_level
-                return
+        chal = self._get_challenge_index().get(challenge_obj)
+        if chal is not None:
+            chal.currently_completed = True
+            chal.is_active = False
+            chal.completed_count = completed_count
+            chal.progress_counter = 0
+            chal.completed_progress_level = progress_level
+            return
 
         # AFAIK we should never get here; rather than create a new one,
         # I'm just going to raise an Exception for now.
@@ -1382,6 +1476,7 @@ class BL3Save(object):
         the vehicle.  The vehicle type key will be a constant by default, or an English
         label if `eng` is `True`
         """
+        from . import chassis_to_vehicle, vehicle_to_eng
         to_ret = {}
         for v in self.save.vehicles_unlocked_data:
             if v.asset_path in chassis_to_vehicle:
@@ -1408,6 +1503,7 @@ class BL3Save(object):
         Unlocks vehicle chassis types for the specified `vehicle_type`, or for all
         vehicle types if a type is not specified
         """
+        from . import CYCLONE, JETBEAST, OUTRUNNER, TECHNICAL, chassis_excluders, vehicle_chassis
         # Construct a list of types
         if vehicle_type:
             types = [vehicle_type]
@@ -1447,6 +1543,7 @@ class BL3Save(object):
         key will be a constant by default, or an English label if `eng` is
         `True`
         """
+        from . import vehicle_to_eng
         to_ret = {}
         for part in self.save.vehicle_parts_unlocked:
             if part in p2v_map:
@@ -1465,6 +1562,7 @@ class BL3Save(object):
         wheels, which are part of the chassis definition) for the vehicle.  The vehicle
         type key will be a constant by default, or an English label if `eng` is `True`
         """
+        from . import part_to_vehicle
         return self._get_vehicle_part_counts(part_to_vehicle, eng=eng)
 
     def get_vehicle_skin_counts(self, eng=False):
@@ -1473,6 +1571,7 @@ class BL3Save(object):
         skins for the vehicle.  The vehicle type key will be a constant by
         default, or an English label if `eng` is `True`
         """
+        from . import skin_to_vehicle
         return self._get_vehicle_part_counts(skin_to_vehicle, eng=eng)
 
     def _get_vehicle_part_count(self, vehicle_type, generic_count_func):
@@ -1511,6 +1610,7 @@ class BL3Save(object):
         reasonable values for `part_struct` are `vehicle_parts` and
         `vehicle_skins`.
         """
+        from . import CYCLONE, JETBEAST, OUTRUNNER, TECHNICAL
         # Construct a list of types
         if vehicle_type:
             types = [vehicle_type]
@@ -1531,6 +1631,7 @@ class BL3Save(object):
         Unlocks vehicle parts for the specified `vehicle_type`, or for all
         vehicle types if a type is not specified
         """
+        from . import vehicle_parts
         return self._unlock_vehicle_parts(vehicle_parts)
 
     def unlock_vehicle_skins(self, vehicle_type=None):
@@ -1538,6 +1639,7 @@ class BL3Save(object):
         Unlocks vehicle skins for the specified `vehicle_type`, or for all
         vehicle types if a type is not specified
         """
+        from . import vehicle_skins
         return self._unlock_vehicle_parts(vehicle_skins)
 
     def get_savegame_guid(self):
@@ -1601,6 +1703,7 @@ class BL3Save(object):
         playthroughs, so you can not be bothered with them on chars you don't intend to
         take into a Takedown.
         """
+        from . import takedown_missions
         for pt in self.save.mission_playthroughs_data:
             # First, complete the missions if they're already present
             mission_seen = set()
@@ -1638,6 +1741,7 @@ class BL3Save(object):
         mission was deleted, or `False` if the specified mission wasn't found,
         or wasn't permitted to be deleted on account of `allow_plot`.
         """
+        from . import plot_missions
         lower = mission_obj.lower()
         if not allow_plot and lower in plot_missions:
             return False
@@ -1657,35 +1761,66 @@ class BL3Save(object):
             del self.save.mission_playthroughs_data[pt].mission_list[idx]
             return True
 
+    def clear_challenge_prefixes(self, prefixes):
+        """
+        Removes all challenge data which matches any of the given `prefixes`
+        (case-insensitively), in a single pass over the challenge list.
+        Completely removes the entries, as opposed to trying to intelligently
+        clear their values.
+        """
+        prefixes_lower = tuple(prefix.lower() for prefix in prefixes)
+        indicies_to_del = []
+        for idx, challenge in enumerate(self.save.challenge_data):
+            if challenge.challenge_class_path.lower().startswith(prefixes_lower):
+                indicies_to_del.append(idx)
+        if not indicies_to_del:
+            return
+
+        # Delete from the end, a contiguous run of entries at a time
+        run_end = indicies_to_del[-1]
+        run_start = run_end
+        for idx in reversed(indicies_to_del[:-1]):
+            if idx != run_start - 1:
+                del self.save.challenge_data[run_start:run_end+1]
+                run_end = idx
+            run_start = idx
+        del self.save.challenge_data[run_start:run_end+1]
+        self._challenge_index = None
+
     def clear_challenge_prefix(self, prefix):
         """
         Removes all challenge data which matches the given `prefix`.  Completely
         removes the entries, as opposed to trying to intelligently clear their
         values.
         """
-        prefix_lower = prefix.lower()
-        indicies_to_del = []
-        for idx, challenge in enumerate(self.save.challenge_data):
-            if challenge.challenge_class_path.lower().startswith(prefix_lower):
-                indicies_to_del.append(idx)
-        for idx in reversed(indicies_to_del):
-            del self.save.challenge_data[idx]
+        self.clear_challenge_prefixes([prefix])
 
     def clear_bloody_harvest(self):
         """
         Clears all Bloody Harvest challenge data
         """
-        self.clear_challenge_prefix('/Game/PatchDLC/BloodyHarvest/')
+        self.clear_challenge_prefix(self._event_bloody_harvest_prefix)
 
     def clear_broken_hearts(self):
         """
         Clears all Broken Hearts challenge data
         """
-        self.clear_challenge_prefix('/Game/PatchDLC/EventVDay/')
+        self.clear_challenge_prefix(self._event_broken_hearts_prefix)
 
     def clear_cartels(self):
         """
         Clears all Revenge of the Cartels challenge data
         """
-        self.clear_challenge_prefix('/Game/PatchDLC/Event2/')
+        self.clear_challenge_prefix(self._event_cartels_prefix)
+
+    def clear_all_events(self):
+        """
+        Clears challenge data for all seasonal events (Bloody Harvest, Broken
+        Hearts, and Revenge of the Cartels)
+        """
+        self.clear_challenge_prefixes([
+            self._event_bloody_harvest_prefix,
+            self._event_broken_hearts_prefix,
+            self._event_cartels_prefix,
+            ])
 
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import io
+import sys
+import shlex
+import contextlib
+import argparse
+import importlib
+import bl3save
+from . import datalib
+
+# The commands which can be run in a batch, and the modules they live in
+commands = {
+        'bl3-save-edit': 'cli_edit',
+        'bl3-save-info': 'cli_info',
+        'bl3-save-import-protobuf': 'cli_import_protobuf',
+        'bl3-save-import-json': 'cli_import_json',
+        'bl3-process-archive-saves': 'cli_archive',
+        'bl3-profile-edit': 'cli_prof_edit',
+        'bl3-profile-info': 'cli_prof_info',
+        'bl3-profile-import-protobuf': 'cli_prof_import_protobuf',
+        'bl3-profile-import-json': 'cli_prof_import_json',
+        'bl3-items-validate': 'cli_items_validate',
+        }
+
+def read_commands(df):
+    """
+    Reads commands from the file object `df`, one per line, using shell-style
+    quoting.  Blank lines and comments (starting with `#`) are skipped.
+    Returns a list of tuples containing the line number, command name, and
+    list of arguments for each.  Raises an exception if any line can't be
+    parsed or uses a command we don't know about, so that nothing gets run
+    from a script with errors in it.
+    """
+    to_ret = []
+    for line_num, line in enumerate(df, start=1):
+        try:
+            words = shlex.split(line, comments=True)
+        except ValueError as e:
+            raise Exception('Unable to parse line {}: {}'.format(line_num, e)) from None
+        if not words:
+            continue
+        if words[0] not in commands:
+            raise Exception('Unknown command on line {}: {}'.format(line_num, words[0]))
+        to_ret.append((line_num, words[0], words[1:]))
+    return to_ret
+
+def get_module(command):
+    """
+    Returns the module which implements `command` (one of the console script
+    names in `commands`)
+    """
+    return importlib.import_module('.{}'.format(commands[command]), __package__)
+
+def check_args(command, args):
+    """
+    Checks the list of `args` against `command`'s argument parser, without
+    running the command.  Returns `None` if they're valid, or otherwise the
+    error message which the command would have printed.
+    """
+    parser = get_module(command).get_parser()
+    parser.prog = command
+    output = io.StringIO()
+    try:
+        # Anything printed here (such as usage info for --help) will get
+        # printed again when the command is actually run
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            parser.parse_args(args)
+    except SystemExit as e:
+        if e.code:
+            # The last line is argparse's actual error, after the usage info
+            lines = output.getvalue().strip().splitlines()
+            if lines:
+                return lines[-1]
+            return 'exited with status {}'.format(e.code)
+    return None
+
+def run_command(command, args):
+    """
+    Runs `command` (one of the console script names in `commands`) with the
+    given list of `args`, in this process.  Returns the command's exit status.
+    Exceptions raised by the command are passed along to the caller.
+    """
+    module = get_module(command)
+    # So that usage/error messages mention the right command
+    orig_argv = sys.argv
+    sys.argv = [command] + args
+    try:
+        module.main(args)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        elif isinstance(e.code, int):
+            return e.code
+        else:
+            print(e.code, file=sys.stderr)
+            return 1
+    finally:
+        sys.argv = orig_argv
+    return 0
+
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
+
+    # Set up args
+    parser = argparse.ArgumentParser(
+            description='BL3 CLI SaveEdit Batch Runner v{}'.format(bl3save.__version__),
+            epilog="""
+                Runs a sequence of the other BL3 CLI SaveEdit commands (such as
+                bl3-save-edit or bl3-profile-info), one per line, with the same
+                arguments they'd be given on the commandline.  Everything runs
+                in a single process, so the item data and any files which are
+                read more than once only need to be loaded once.  Every
+                command's arguments are checked before anything is run.
+                Commands which would ask for confirmation before overwriting a
+                file should be given -f/--force.
+            """
+            )
+
+    parser.add_argument('-V', '--version',
+            action='version',
+            version='BL3 CLI SaveEdit v{}'.format(bl3save.__version__),
+            )
+
+    subparsers = parser.add_subparsers(
+            dest='action',
+            required=True,
+            )
+
+    run_parser = subparsers.add_parser('run',
+            help='Run the commands in a script file',
+            )
+    batch_parser = subparsers.add_parser('batch',
+            help='Run commands read from standard input',
+            )
+    for subparser in [run_parser, batch_parser]:
+        subparser.add_argument('-k', '--keep-going',
+                action='store_true',
+                help='Keep running commands after one fails',
+                )
+        subparser.add_argument('-v', '--verbose',
+                action='store_true',
+                help='Print each command before running it',
+                )
+    run_parser.add_argument('script',
+            help='Script file containing the commands to run',
+            )
+
+    return parser
+
+def main(argv=None):
+
+    # Parse args
+    args = get_parser().parse_args(argv)
+
+    # Read in all the commands first, so that we don't run anything from a
+    # script with errors in it.  (When reading from stdin, this also means
+    # that commands which prompt for input won't consume later commands.)
+    if args.action == 'run':
+        with open(args.script) as df:
+            steps = read_commands(df)
+    else:
+        steps = read_commands(sys.stdin)
+
+    # Also check each command's arguments
+    invalid = 0
+    for line_num, command, command_args in steps:
+        error = check_args(command, command_args)
+        if error is not None:
+            invalid += 1
+            print('Invalid arguments on line {}: {}'.format(line_num, error), file=sys.stderr)
+    if invalid > 0:
+        sys.exit(2)
+
+    # Cache decrypted savegames/profiles between commands
+    datalib.enable_file_cache()
+
+    # Now run them
+    failures = 0
+    for line_num, command, command_args in steps:
+        if args.verbose:
+            print('+ {}'.format(shlex.join([command] + command_args)))
+            sys.stdout.flush()
+        try:
+            status = run_command(command, command_args)
+        except Exception as e:
+            print('ERROR: {}'.format(e), file=sys.stderr)
+            status = 1
+        if status != 0:
+            failures += 1
+            print('Command on line {} failed: {}'.format(line_num, command), file=sys.stderr)
+            if not args.keep_going:
+                sys.exit(status)
+    if failures > 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
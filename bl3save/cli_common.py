@@ -23,6 +23,7 @@
 
 import csv
 import argparse
+from . import datalib
 
 class DictAction(argparse.Action):
     """
@@ -152,6 +153,76 @@ def import_items(import_file, item_create_func, item_add_func, file_csv=False, a
     if not quiet:
         print('   - Added Item Count: {}'.format(added_count))
 
+def read_item_codes(import_file, file_csv=False):
+    """
+    Reads `import_file` and yields a tuple for each item code found, containing
+    the line number the code was found on, and the code itself.  This uses the
+    same rules as `import_items`: if `file_csv` is `True`, codes are found
+    in any cell of the CSV; otherwise a line must consist solely of the code.
+    """
+    if file_csv:
+        with open(import_file) as df:
+            reader = csv.reader(df)
+            for row in reader:
+                for cell in row:
+                    cell = cell.strip()
+                    if cell.lower().startswith('bl3(') and cell.endswith(')'):
+                        yield (reader.line_num, cell)
+    else:
+        with open(import_file) as df:
+            for line_num, line in enumerate(df, start=1):
+                itemline = line.strip()
+                if itemline.lower().startswith('bl3(') and itemline.endswith(')'):
+                    yield (line_num, itemline)
+
+def validate_item_codes(codes, jobs=1):
+    """
+    Validates each of the given `BL3()`-encoded item `codes`, yielding the
+    result of `BL3Serial.validate_serial_base64` for each (`None` for valid
+    codes, or an error string), in order.  If `jobs` is greater than one, the
+    work will be spread across that many processes.  No item objects are
+    created, and the item databases are never loaded.
+    """
+    if jobs is not None and jobs > 1:
+        # Only imported when needed, since it takes a while
+        import concurrent.futures
+        codes = list(codes)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(codes) // (jobs*4))
+            yield from executor.map(datalib.BL3Serial.validate_serial_base64, codes, chunksize=chunksize)
+    else:
+        for code in codes:
+            yield datalib.BL3Serial.validate_serial_base64(code)
+
+def validate_items(import_file, file_csv=False, jobs=1, quiet=False):
+    """
+    Checks all item codes found in `import_file` for validity, reporting the
+    status of each one.  If `file_csv` is `True`, we will process the file as
+    if it's a CSV, otherwise we'll process as if it's a "regular" text file.
+    `jobs` specifies the number of processes to use.  If `quiet` is `True`,
+    only invalid codes will be reported.  Returns a tuple containing the
+    number of valid codes and the number of invalid codes.
+    """
+    found = list(read_item_codes(import_file, file_csv=file_csv))
+    valid_count = 0
+    invalid_count = 0
+    results = validate_item_codes([code for (_, code) in found], jobs=jobs)
+    for (line_num, code), error in zip(found, results):
+        if error is None:
+            valid_count += 1
+            if not quiet:
+                print('{}:{}: OK'.format(import_file, line_num))
+        else:
+            invalid_count += 1
+            print('{}:{}: INVALID: {}'.format(import_file, line_num, error))
+    if not quiet:
+        print('Checked {} item codes: {} valid, {} invalid'.format(
+            valid_count + invalid_count,
+            valid_count,
+            invalid_count,
+            ))
+    return (valid_count, invalid_count)
+
 def update_item_levels(items, to_level, quiet=False):
     """
     Given a list of `items`, update their base level to `level`.  If `quiet`
@@ -246,3 +317,104 @@ def update_item_mayhem_levels(items, to_level, quiet=False):
             not_possible_txt
             ))
 
+def upgrade_item_serials(items, quiet=False):
+    """
+    Given a list of `items`, re-encode their serials using the latest
+    inventory serial DB version we know about.  Items which can't be
+    upgraded will be reported regardless of `quiet`; otherwise, if `quiet`
+    is `True`, only errors will be printed.
+    """
+    num_items = len(items)
+    if not quiet:
+        if num_items == 1:
+            plural = ''
+        else:
+            plural = 's'
+        print(' - Upgrading {} item serial{} to the latest version'.format(
+            num_items,
+            plural,
+            ))
+    actually_updated = 0
+    not_possible = []
+    for item in items:
+        old_version = item.version
+        if not item.upgrade_serial():
+            not_possible.append(item)
+        elif item.version != old_version:
+            actually_updated += 1
+    for item in not_possible:
+        if item.eng_name:
+            print('   - NOTICE: Unable to upgrade serial for {} ({})'.format(
+                item.eng_name,
+                item.get_serial_base64(),
+                ))
+        else:
+            print('   - NOTICE: Unable to upgrade serial for unknown item ({})'.format(
+                item.get_serial_base64(),
+                ))
+    if not quiet:
+        remaining = num_items - actually_updated - len(not_possible)
+        if actually_updated == 1:
+            updated_verb = 'was'
+        else:
+            updated_verb = 'were'
+        if remaining > 0:
+            if remaining == 1:
+                remaining_verb = 'was'
+            else:
+                remaining_verb = 'were'
+            remaining_txt = ' ({} {} already at the latest version)'.format(remaining, remaining_verb)
+        else:
+            remaining_txt = ''
+        if len(not_possible) > 0:
+            if len(not_possible) == 1:
+                not_possible_verb = 'was'
+            else:
+                not_possible_verb = 'were'
+            not_possible_txt = ' ({} {} unable to be upgraded)'.format(len(not_possible), not_possible_verb)
+        else:
+            not_possible_txt = ''
+        print('   - {} {} updated{}{}'.format(
+            actually_updated,
+            updated_verb,
+            remaining_txt,
+            not_possible_txt
+            ))
+
+def report_timing(start_time, load_start, load_end, datawrapper):
+    """
+    Reports on how long it took to load a savegame/profile (between
+    `load_start` and `load_end`) and our item data (from `datawrapper`),
+    including how much of that happened at the same time, if the data was
+    prefetched.  Item data lookup cache stats are reported as well.  All
+    times should come from `time.perf_counter`, and will be reported
+    relative to `start_time`.
+    """
+    print('Timing:')
+    print(' - File load: {:.1f}ms to {:.1f}ms'.format(
+        (load_start-start_time)*1000,
+        (load_end-start_time)*1000,
+        ))
+    if datawrapper.prefetch_start is not None:
+        if datawrapper.prefetch_end is None:
+            print(' - Item data prefetch: started at {:.1f}ms, not finished'.format(
+                (datawrapper.prefetch_start-start_time)*1000,
+                ))
+        else:
+            print(' - Item data prefetch: {:.1f}ms to {:.1f}ms'.format(
+                (datawrapper.prefetch_start-start_time)*1000,
+                (datawrapper.prefetch_end-start_time)*1000,
+                ))
+            overlap = min(load_end, datawrapper.prefetch_end) - max(load_start, datawrapper.prefetch_start)
+            print(' - Overlap: {:.1f}ms'.format(max(0, overlap)*1000))
+    for name, load_time in datawrapper.get_load_times().items():
+        if load_time is None:
+            print(' - {}: not loaded'.format(name))
+        else:
+            print(' - {}: {:.1f}ms'.format(name, load_time*1000))
+    for name, stats in datawrapper.get_cache_stats().items():
+        print(' - {} lookups: {} cached, {} uncached'.format(
+            name,
+            stats['hits'],
+            stats['misses'],
+            ))
@@ -27,7 +27,10 @@ import argparse
 import bl3save
 from bl3save.bl3save import BL3Save
 
-def main():
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
 
     # Set up args
     parser = argparse.ArgumentParser(
@@ -60,8 +63,12 @@ def main():
             action='store_true',
             help='Clobber (overwrite) files without asking')
 
+    return parser
+
+def main(argv=None):
+
     # Parse args
-    args = parser.parse_args()
+    args = get_parser().parse_args(argv)
 
     # Make sure that files exist
     if not os.path.exists(args.filename_from):
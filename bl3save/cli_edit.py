@@ -26,10 +26,22 @@ import sys
 import bl3save
 import argparse
 from . import cli_common
-from . import plot_missions
 from bl3save.bl3save import BL3Save
 
-def main():
+# Features which can be unlocked with --unlock
+unlock_choices = [
+        'ammo', 'backpack',
+        'analyzer', 'resonator',
+        'gunslots', 'artifactslot', 'comslot', 'allslots',
+        'tvhm',
+        'vehicles', 'vehicleskins',
+        'cubepuzzle',
+        ]
+
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
 
     # Set up args
     parser = argparse.ArgumentParser(
@@ -135,6 +147,11 @@ def main():
             choices=range(bl3save.mayhem_max+1),
             help='Set all inventory items to the specified Mayhem level (0 to remove)')
 
+    parser.add_argument('--item-upgrade-serials',
+            dest='item_upgrade_serials',
+            action='store_true',
+            help='Re-encode all inventory items using the latest item serial version')
+
     parser.add_argument('--mayhem',
             type=int,
             choices=range(12),
@@ -163,14 +180,6 @@ def main():
             help='Clears out the Takedown Discovery missions so they don\'t clutter your UI',
             )
 
-    unlock_choices = [
-            'ammo', 'backpack',
-            'analyzer', 'resonator',
-            'gunslots', 'artifactslot', 'comslot', 'allslots',
-            'tvhm',
-            'vehicles', 'vehicleskins',
-            'cubepuzzle',
-            ]
     parser.add_argument('--unlock',
             action=cli_common.DictAction,
             choices=unlock_choices + ['all'],
@@ -265,8 +274,12 @@ def main():
             help='Output filename',
             )
 
+    return parser
+
+def main(argv=None):
+
     # Parse args
-    args = parser.parse_args()
+    args = get_parser().parse_args(argv)
     if args.level is not None:
         if args.level < 1 or args.level > bl3save.max_supported_level:
             raise argparse.ArgumentTypeError('Valid level range is 1 through {} (currently known in-game max of {})'.format(
@@ -317,7 +330,7 @@ def main():
     for arg in [args.delete_pt1_mission, args.delete_pt2_mission]:
         if arg is not None:
             for mission in arg:
-                if mission.lower() in plot_missions:
+                if mission.lower() in bl3save.plot_missions:
                     raise argparse.ArgumentTypeError('Plot mission cannot be deleted: {}'.format(mission))
 
     # Check for overwrite warnings
@@ -374,6 +387,7 @@ def main():
         args.item_levels,
         args.unfinish_nvhm,
         args.item_mayhem_levels is not None,
+        args.item_upgrade_serials,
         args.delete_pt1_mission is not None,
         args.delete_pt2_mission is not None,
         args.clear_bloody_harvest,
@@ -470,20 +484,26 @@ def main():
                                 ))
 
         # Clearing seasonal event status
-        if args.clear_bloody_harvest or args.clear_all_events:
+        if args.clear_all_events:
             if not args.quiet:
-                print(' - Clearing Bloody Harvest challenge state')
-            save.clear_bloody_harvest()
+                print(' - Clearing Bloody Harvest, Broken Hearts, and Cartels challenge state')
+            save.clear_all_events()
 
-        if args.clear_broken_hearts or args.clear_all_events:
-            if not args.quiet:
-                print(' - Clearing Broken Hearts challenge state')
-            save.clear_broken_hearts()
+        else:
+            if args.clear_bloody_harvest:
+                if not args.quiet:
+                    print(' - Clearing Bloody Harvest challenge state')
+                save.clear_bloody_harvest()
 
-        if args.clear_cartels or args.clear_all_events:
-            if not args.quiet:
-                print(' - Clearing Cartels challenge state')
-            save.clear_cartels()
+            if args.clear_broken_hearts:
+                if not args.quiet:
+                    print(' - Clearing Broken Hearts challenge state')
+                save.clear_broken_hearts()
+
+            if args.clear_cartels:
+                if not args.quiet:
+                    print(' - Clearing Cartels challenge state')
+                save.clear_cartels()
 
         # Unlocks
         if len(args.unlock) > 0:
@@ -597,6 +617,12 @@ def main():
                     quiet=args.quiet,
                     )
 
+        # Item serial upgrades
+        if args.item_upgrade_serials:
+            cli_common.upgrade_item_serials(save.get_items(),
+                    quiet=args.quiet,
+                    )
+
         # Copying NVHM/TVHM state (or otherwise fiddle with playthroughs)
         if args.copy_nvhm:
             if not args.quiet:
@@ -21,12 +21,18 @@
 # 
 # 3. This notice may not be removed or altered from any source distribution.
 
+import time
 import bl3save
 import argparse
 import itertools
+from . import datalib
+from . import cli_common
 from bl3save.bl3save import BL3Save
 
-def main():
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
 
     # Arguments
     parser = argparse.ArgumentParser(
@@ -48,6 +54,11 @@ def main():
             help='Show inventory items',
             )
 
+    parser.add_argument('--find',
+            type=str,
+            help='Only show items whose names contain the given text (implies --items)',
+            )
+
     parser.add_argument('--all-missions',
             dest='all_missions',
             action='store_true',
@@ -67,14 +78,34 @@ def main():
             action='store_true',
             help='Show all unlocked Fast Travel stations')
 
+    parser.add_argument('--timing',
+            action='store_true',
+            help='Report how long it took to load the file and item data',
+            )
+
     parser.add_argument('filename',
             help='Filename to process',
             )
 
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+
+    args = get_parser().parse_args(argv)
+    start_time = time.perf_counter()
+    if args.find:
+        args.items = True
+
+    # If we're going to report on items, start loading our item data in the
+    # background while we load the file itself.
+    datawrapper = datalib.get_shared_datawrapper()
+    if args.verbose or args.items:
+        datawrapper.prefetch()
 
     # Load the save
-    save = BL3Save(args.filename)
+    load_start = time.perf_counter()
+    save = BL3Save(args.filename, datawrapper=datawrapper)
+    load_end = time.perf_counter()
 
     # Character name
     print('Character: {}'.format(save.get_char_name()))
@@ -202,8 +233,13 @@ def main():
     # Inventory
     if args.verbose or args.items:
         items = save.get_items()
+        if args.find:
+            items = datawrapper.name_index.find_items(items, args.find)
         if len(items) == 0:
-            print('Nothing in Inventory')
+            if args.find:
+                print('No matching items in Inventory')
+            else:
+                print('Nothing in Inventory')
         else:
             print('Inventory:')
             to_report = []
@@ -218,6 +254,9 @@ def main():
     # Equipped Items
     if args.verbose or args.items:
         items = save.get_equipped_items(True)
+        if args.find:
+            matching = datawrapper.name_index.find_items([item for item in items.values() if item], args.find)
+            items = {slot: item for (slot, item) in items.items() if item in matching}
         if any(items.values()):
             print('Equipped Items:')
             to_report = []
@@ -273,5 +312,9 @@ def main():
             save.get_vehicle_skin_count(vehicle), len(bl3save.vehicle_skins[vehicle]),
             ))
 
+    # Timing report
+    if args.timing:
+        cli_common.report_timing(start_time, load_start, load_end, datawrapper)
+
 if __name__ == '__main__':
     main()
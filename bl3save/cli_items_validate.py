@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import sys
+import argparse
+import bl3save
+from . import cli_common
+
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
+
+    # Set up args
+    parser = argparse.ArgumentParser(
+            description='Validate BL3 Item Codes v{}'.format(bl3save.__version__),
+            epilog="""
+                Checks every BL3() item code found in the given file for
+                validity (base64 encoding, serial header, and checksum),
+                without actually importing anything.  Exits with a nonzero
+                status if any invalid codes are found.
+            """
+            )
+
+    parser.add_argument('-V', '--version',
+            action='version',
+            version='BL3 CLI SaveEdit v{}'.format(bl3save.__version__),
+            )
+
+    parser.add_argument('--csv',
+            action='store_true',
+            help='Process the file as a CSV',
+            )
+
+    parser.add_argument('-j', '--jobs',
+            type=int,
+            default=1,
+            help='Number of processes to use while validating',
+            )
+
+    parser.add_argument('-q', '--quiet',
+            action='store_true',
+            help='Only report invalid item codes')
+
+    parser.add_argument('filename',
+            help='Filename containing item codes',
+            )
+
+    return parser
+
+def main(argv=None):
+
+    # Parse args
+    args = get_parser().parse_args(argv)
+    if args.jobs < 1:
+        raise argparse.ArgumentTypeError('--jobs must be at least 1')
+
+    # Make sure the file exists
+    if not os.path.exists(args.filename):
+        raise Exception('Filename {} does not exist'.format(args.filename))
+
+    # Validate!
+    (valid_count, invalid_count) = cli_common.validate_items(args.filename,
+            file_csv=args.csv,
+            jobs=args.jobs,
+            quiet=args.quiet,
+            )
+    if invalid_count > 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
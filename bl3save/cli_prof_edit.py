@@ -28,7 +28,19 @@ import argparse
 from . import cli_common
 from bl3save.bl3profile import BL3Profile
 
-def main():
+# Features which can be unlocked with --unlock
+unlock_choices = [
+        'lostloot', 'bank',
+        'skins', 'heads',
+        'echothemes', 'emotes', 'decos',
+        'weaponskins', 'trinkets',
+        'customizations',
+        ]
+
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
 
     # Set up args
     parser = argparse.ArgumentParser(
@@ -196,6 +208,11 @@ def main():
             choices=range(bl3save.mayhem_max+1),
             help='Set all bank items to the specified Mayhem level (0 to remove)')
 
+    parser.add_argument('--item-upgrade-serials',
+            dest='item_upgrade_serials',
+            action='store_true',
+            help='Re-encode all bank items using the latest item serial version')
+
     parser.add_argument('-i', '--import-items',
             dest='import_items',
             type=str,
@@ -220,13 +237,6 @@ def main():
             help='Alphabetize unlocked room decorations, trinkets, and weapon skins',
             )
 
-    unlock_choices = [
-            'lostloot', 'bank',
-            'skins', 'heads',
-            'echothemes', 'emotes', 'decos',
-            'weaponskins', 'trinkets',
-            'customizations',
-            ]
     parser.add_argument('--unlock',
             action=cli_common.DictAction,
             choices=unlock_choices + ['all'],
@@ -243,8 +253,12 @@ def main():
             help='Output filename',
             )
 
+    return parser
+
+def main(argv=None):
+
     # Parse args
-    args = parser.parse_args()
+    args = get_parser().parse_args(argv)
 
     # Expand any of our "all" unlock actions
     if 'all' in args.unlock:
@@ -343,6 +357,7 @@ def main():
         args.clear_customizations,
         args.alpha,
         args.item_mayhem_levels is not None,
+        args.item_upgrade_serials,
         ])
 
     # Alert about Guardian Rank stuff
@@ -565,6 +580,12 @@ def main():
                     quiet=args.quiet,
                     )
 
+        # Item serial upgrades
+        if args.item_upgrade_serials:
+            cli_common.upgrade_item_serials(profile.get_bank_items(),
+                    quiet=args.quiet,
+                    )
+
         # Guardian Rank Alert
         if not args.quiet and guardian_rank_alert:
             print(' - NOTE: Make sure to zero out your savegame Guardian Ranks, if making')
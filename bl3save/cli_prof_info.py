@@ -21,12 +21,18 @@
 # 
 # 3. This notice may not be removed or altered from any source distribution.
 
+import time
 import bl3save
 import argparse
 import itertools
+from . import datalib
+from . import cli_common
 from bl3save.bl3profile import BL3Profile
 
-def main():
+def get_parser():
+    """
+    Returns the argument parser for this command
+    """
 
     # Arguments
     parser = argparse.ArgumentParser(
@@ -48,14 +54,39 @@ def main():
             help='Show inventory items',
             )
 
+    parser.add_argument('--find',
+            type=str,
+            help='Only show items whose names contain the given text (implies --items)',
+            )
+
+    parser.add_argument('--timing',
+            action='store_true',
+            help='Report how long it took to load the file and item data',
+            )
+
     parser.add_argument('filename',
             help='Filename to process',
             )
 
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+
+    args = get_parser().parse_args(argv)
+    start_time = time.perf_counter()
+    if args.find:
+        args.items = True
+
+    # If we're going to report on items, start loading our item data in the
+    # background while we load the file itself.
+    datawrapper = datalib.get_shared_datawrapper()
+    if args.verbose or args.items:
+        datawrapper.prefetch()
 
     # Load the profile
-    prof = BL3Profile(args.filename)
+    load_start = time.perf_counter()
+    prof = BL3Profile(args.filename, datawrapper=datawrapper)
+    load_end = time.perf_counter()
 
     # Golden Keys
     print('Keys:')
@@ -87,7 +118,11 @@ def main():
 
     # Bank Items
     bank_items = prof.get_bank_items()
-    print('Items in bank: {}'.format(len(bank_items)))
+    if args.find:
+        bank_items = datawrapper.name_index.find_items(bank_items, args.find)
+        print('Matching items in bank: {}'.format(len(bank_items)))
+    else:
+        print('Items in bank: {}'.format(len(bank_items)))
     if args.verbose or args.items:
         to_report = []
         for item in bank_items:
@@ -100,7 +135,11 @@ def main():
 
     # Lost Loot Items
     lostloot_items = prof.get_lostloot_items()
-    print('Items in Lost Loot machine: {}'.format(len(lostloot_items)))
+    if args.find:
+        lostloot_items = datawrapper.name_index.find_items(lostloot_items, args.find)
+        print('Matching items in Lost Loot machine: {}'.format(len(lostloot_items)))
+    else:
+        print('Items in Lost Loot machine: {}'.format(len(lostloot_items)))
     if args.verbose or args.items:
         to_report = []
         for item in lostloot_items:
@@ -123,5 +162,20 @@ def main():
             ]:
         print('{} Unlocked: {}/{}'.format(label, len(current), maxcount))
 
+    # Weapon customizations that we don't know about (from game updates, etc)
+    unknown_custs = prof.get_unknown_weapon_customizations(resolve=args.verbose)
+    if unknown_custs:
+        print('Unknown Weapon Customizations Unlocked: {}'.format(len(unknown_custs)))
+        if args.verbose:
+            for cust_hash, path in sorted(unknown_custs.items(), key=lambda c: (c[1] is None, c[1], c[0])):
+                if path is None:
+                    print(' - Unknown hash: 0x{:08X}'.format(cust_hash))
+                else:
+                    print(' - {} (0x{:08X})'.format(path, cust_hash))
+
+    # Timing report
+    if args.timing:
+        cli_common.report_timing(start_time, load_start, load_end, datawrapper)
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+#
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+
+# Compiled, memory-mappable versions of the data files in `resources/`.
+#
+# Decompressing and parsing our `.json.xz` files is the most expensive
+# part of starting up for short runs, so we also ship "compiled" `.bin`
+# versions of each, which can be mmapped and read from directly, without
+# having to parse the whole thing up-front.  The compiled files are
+# generated from the `.json.xz` files by running this module directly:
+#
+#     python -m bl3save.compileddb
+#
+# Each compiled file records the SHA-256 hash of the `.json.xz` file it
+# was generated from; if that doesn't match, the compiled file is ignored
+# and the app falls back to the JSON data.
+#
+# File layout (all integers little-endian):
+#
+#   Header: magic, format version, kind, source hash, string count, and two
+#       kind-specific counts (see `_header`)
+#   String offsets: (string count + 1) uint32s, relative to the start of
+#       the string data
+#   Kind-specific tables:
+#       KIND_MAPPING: one (key string, value string) uint32 pair per entry,
+#           sorted by the UTF-8 encoding of the key
+#       KIND_SERIAL_DB: the max serial version (uint32), then one (name
+#           string, first version row, version row count, first asset
+#           string, asset count, first sorted index entry) record per
+#           category, all the (version, bits) uint16 version rows, a
+#           uint8 bit width for every version from 0 to the max, for each
+#           category, and finally a uint32 index into each category's
+#           assets, sorted by asset name (for name lookups)
+#   String data: UTF-8 strings, one after another
+
+import os
+import lzma
+import json
+import mmap
+import struct
+import hashlib
+import pathlib
+import argparse
+import collections.abc
+
+MAGIC = b'BL3CDB'
+FORMAT_VERSION = 2
+
+KIND_MAPPING = 1
+KIND_SERIAL_DB = 2
+
+# The data files we know how to compile, along with their kinds
+RESOURCES = {
+        'inventoryserialdb': KIND_SERIAL_DB,
+        'balance_name_mapping': KIND_MAPPING,
+        'balance_to_inv_key': KIND_MAPPING,
+        }
+
+_header = struct.Struct('<6sHH32sIII')
+_offset = struct.Struct('<I')
+_offset_pair = struct.Struct('<II')
+_max_version = struct.Struct('<I')
+_category = struct.Struct('<IIIIII')
+_version_row = struct.Struct('<HH')
+
+def source_hash(source_data):
+    """
+    Returns the hash we store for the given source `.json.xz` data
+    """
+    return hashlib.sha256(source_data).digest()
+
+def compute_bit_table(versions, max_version):
+    """
+    Given a serial DB category's list of `versions`, returns a list of the
+    number of bits used by that category for every serial version from 0
+    through `max_version`.  Versions before the first one listed use the
+    first one's bit width.
+    """
+    table = []
+    cur_bits = versions[0]['bits']
+    ver_idx = 0
+    for version in range(max_version+1):
+        while ver_idx < len(versions) and versions[ver_idx]['version'] <= version:
+            cur_bits = versions[ver_idx]['bits']
+            ver_idx += 1
+        table.append(cur_bits)
+    return table
+
+class CompiledData(object):
+    """
+    Base class for reading a compiled data file out of `buf` (which can be
+    an `mmap`, a `memoryview` such as a shared memory buffer, or anything
+    else supporting the buffer protocol).  Mostly this just handles the
+    header and the string table.
+    """
+
+    def __init__(self, buf, kind):
+        self.buf = buf
+        (magic,
+                file_format,
+                file_kind,
+                self.source_hash,
+                self.num_strings,
+                self.count_a,
+                self.count_b) = _header.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise Exception('Not a compiled data file')
+        if file_format != FORMAT_VERSION:
+            raise Exception('Unknown compiled data format: {}'.format(file_format))
+        if file_kind != kind:
+            raise Exception('Compiled data file is kind {}, expected {}'.format(file_kind, kind))
+        self._offsets_start = _header.size
+        self._tables_start = self._offsets_start + (self.num_strings+1)*_offset.size
+
+    def _set_strings_start(self, tables_size):
+        """
+        Sets where our string data begins, given the size of the kind-specific
+        tables.  Should be called by subclasses after reading the header.
+        """
+        self._strings_start = self._tables_start + tables_size
+
+    def get_string_bytes(self, idx):
+        """
+        Returns the raw UTF-8 data for the string at index `idx`
+        """
+        (start, end) = _offset_pair.unpack_from(self.buf, self._offsets_start + idx*_offset.size)
+        return bytes(self.buf[self._strings_start+start:self._strings_start+end])
+
+    def get_string(self, idx):
+        """
+        Returns the string at index `idx`
+        """
+        return str(self.get_string_bytes(idx), 'utf-8')
+
+class CompiledStringList(collections.abc.Sequence):
+    """
+    A read-only list of `count` consecutive strings from a compiled data
+    file, starting at string index `start`.  Strings are only decoded when
+    they're actually requested, and are kept around once they have been.
+    """
+
+    def __init__(self, data, start, count):
+        self.data = data
+        self.start = start
+        self.count = count
+        self.strings = None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.count))]
+        if idx < 0:
+            idx += self.count
+        if idx < 0 or idx >= self.count:
+            raise IndexError('list index out of range')
+        if self.strings is None:
+            self.strings = [None]*self.count
+        string = self.strings[idx]
+        if string is None:
+            string = self.data.get_string(self.start + idx)
+            self.strings[idx] = string
+        return string
+
+class CompiledMapping(CompiledData, collections.abc.Mapping):
+    """
+    A read-only string-to-string mapping from a compiled data file.  Keys
+    are found with a binary search through the sorted key table, so nothing
+    needs to be parsed ahead of time.
+    """
+
+    def __init__(self, buf):
+        super().__init__(buf, KIND_MAPPING)
+        self.num_entries = self.count_a
+        self._set_strings_start(self.num_entries*_offset_pair.size)
+
+    def _get_entry(self, idx):
+        """
+        Returns the (key string index, value string index) tuple for entry `idx`
+        """
+        return _offset_pair.unpack_from(self.buf, self._tables_start + idx*_offset_pair.size)
+
+    def _find(self, key):
+        """
+        Returns the value string index for `key`, or `None`
+        """
+        key = key.encode('utf-8')
+        low = 0
+        high = self.num_entries
+        while low < high:
+            mid = (low+high)//2
+            (key_idx, value_idx) = self._get_entry(mid)
+            cur_key = self.get_string_bytes(key_idx)
+            if cur_key < key:
+                low = mid+1
+            elif cur_key > key:
+                high = mid
+            else:
+                return value_idx
+        return None
+
+    def __getitem__(self, key):
+        value_idx = self._find(key)
+        if value_idx is None:
+            raise KeyError(key)
+        return self.get_string(value_idx)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self.num_entries
+
+    def __iter__(self):
+        for idx in range(self.num_entries):
+            yield self.get_string(self._get_entry(idx)[0])
+
+class CompiledSerialDB(CompiledData, collections.abc.Mapping):
+    """
+    A compiled inventory serial DB.  This mimics the structure of the JSON
+    version (a dict of categories, each with a `versions` list and an
+    `assets` list), but each category's data is only read when it's asked
+    for, and asset names are only decoded as they're accessed.  Bit width
+    tables and name lookups are precomputed, and can be accessed with
+    `get_bit_table` and `find_asset`.
+    """
+
+    def __init__(self, buf):
+        super().__init__(buf, KIND_SERIAL_DB)
+        self.num_categories = self.count_a
+        self.num_version_rows = self.count_b
+        (self.max_version,) = _max_version.unpack_from(self.buf, self._tables_start)
+        self._categories_start = self._tables_start + _max_version.size
+        self._versions_start = self._categories_start + self.num_categories*_category.size
+        self._bits_start = self._versions_start + self.num_version_rows*_version_row.size
+        self._sorted_start = self._bits_start + self.num_categories*(self.max_version+1)
+
+        # There's only a few dozen categories, so read the category table
+        # up-front.  We need the total asset count to know where the string
+        # data starts, so the names have to wait until after that.
+        records = [_category.unpack_from(self.buf, self._categories_start + idx*_category.size)
+                for idx in range(self.num_categories)]
+        num_assets = sum([record[4] for record in records])
+        self._set_strings_start(self._sorted_start - self._tables_start + num_assets*_offset.size)
+        self.categories = {}
+        for idx, record in enumerate(records):
+            self.categories[self.get_string(record[0])] = (idx,) + record[1:]
+        self.category_cache = {}
+
+    def __getitem__(self, category):
+        if category not in self.category_cache:
+            (_, ver_start, ver_count, asset_start, asset_count, _) = self.categories[category]
+            versions = []
+            for idx in range(ver_start, ver_start+ver_count):
+                (version, bits) = _version_row.unpack_from(self.buf, self._versions_start + idx*_version_row.size)
+                versions.append({'version': version, 'bits': bits})
+            self.category_cache[category] = {
+                    'versions': versions,
+                    'assets': CompiledStringList(self, asset_start, asset_count),
+                    }
+        return self.category_cache[category]
+
+    def __contains__(self, category):
+        return category in self.categories
+
+    def __len__(self):
+        return self.num_categories
+
+    def get_bit_table(self, category):
+        """
+        Returns a list of the number of bits used by `category` for every
+        serial version from 0 through `max_version`
+        """
+        start = self._bits_start + self.categories[category][0]*(self.max_version+1)
+        return list(self.buf[start:start+self.max_version+1])
+
+    def find_asset(self, category, name):
+        """
+        Returns the (1-based) index of the asset `name` in `category`, or
+        `None` if it's not found.  If the name appears more than once, the
+        first index is returned.
+        """
+        (_, _, _, asset_start, asset_count, sorted_start) = self.categories[category]
+        name = name.encode('utf-8')
+        low = 0
+        high = asset_count
+        while low < high:
+            mid = (low+high)//2
+            (asset_idx,) = _offset.unpack_from(self.buf, self._sorted_start + (sorted_start+mid)*_offset.size)
+            if self.get_string_bytes(asset_start + asset_idx) < name:
+                low = mid+1
+            else:
+                high = mid
+        if low < asset_count:
+            (asset_idx,) = _offset.unpack_from(self.buf, self._sorted_start + (sorted_start+low)*_offset.size)
+            if self.get_string_bytes(asset_start + asset_idx) == name:
+                return asset_idx+1
+        return None
+
+    def __iter__(self):
+        return iter(self.categories)
+
+def load(resource, source_data, kind):
+    """
+    Loads the compiled data file `resource` (a `pathlib.Path`, or any
+    `importlib.resources` Traversable) as the given `kind`, if possible.
+    Files on disk are mmapped; anything else is read into memory.  Returns
+    `None` if the file doesn't exist, can't be read, or wasn't compiled from
+    `source_data`, in which case the caller should fall back to the source.
+    """
+    if kind == KIND_MAPPING:
+        cls = CompiledMapping
+    elif kind == KIND_SERIAL_DB:
+        cls = CompiledSerialDB
+    else:
+        raise Exception('Unknown compiled data kind: {}'.format(kind))
+    try:
+        if not resource.is_file():
+            return None
+        if isinstance(resource, pathlib.Path):
+            with open(resource, 'rb') as df:
+                buf = mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = resource.read_bytes()
+        data = cls(buf)
+    except Exception:
+        return None
+    if data.source_hash != source_hash(source_data):
+        return None
+    return data
+
+class _StringTable(object):
+    """
+    Helper for building the string table of a compiled data file
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.lookup = {}
+
+    def add(self, string, dedupe=True):
+        """
+        Adds `string` to the table and returns its index.  If `dedupe` is
+        `True`, an existing copy of the string will be reused if possible.
+        """
+        if dedupe and string in self.lookup:
+            return self.lookup[string]
+        idx = len(self.strings)
+        self.strings.append(string.encode('utf-8'))
+        if dedupe:
+            self.lookup[string] = idx
+        return idx
+
+    def get_parts(self):
+        """
+        Returns a tuple containing the encoded offsets table and string data
+        """
+        offsets = [0]
+        for string in self.strings:
+            offsets.append(offsets[-1] + len(string))
+        return (
+                struct.pack('<{}I'.format(len(offsets)), *offsets),
+                b''.join(self.strings),
+                )
+
+def compile_mapping(mapping, src_hash):
+    """
+    Compiles the string-to-string `mapping` (generated from data with the
+    hash `src_hash`), returning the compiled data.
+    """
+    strings = _StringTable()
+    entries = []
+    for key in sorted(mapping.keys(), key=lambda k: k.encode('utf-8')):
+        entries.append(_offset_pair.pack(strings.add(key), strings.add(mapping[key])))
+    (offsets, string_data) = strings.get_parts()
+    return b''.join([
+        _header.pack(MAGIC, FORMAT_VERSION, KIND_MAPPING, src_hash,
+            len(strings.strings), len(entries), 0),
+        offsets,
+        b''.join(entries),
+        string_data,
+        ])
+
+def compile_serial_db(db, src_hash):
+    """
+    Compiles the inventory serial DB `db` (generated from data with the
+    hash `src_hash`), returning the compiled data.
+    """
+    max_version = max([max([v['version'] for v in category['versions']]) for category in db.values()])
+    strings = _StringTable()
+    categories = []
+    version_rows = []
+    bit_tables = []
+    sorted_indexes = []
+    for name, category in db.items():
+        name_idx = strings.add(name)
+        ver_start = len(version_rows)
+        for version in category['versions']:
+            version_rows.append(_version_row.pack(version['version'], version['bits']))
+        bit_tables.append(bytes(compute_bit_table(category['versions'], max_version)))
+        # Assets need to be contiguous in the string table, so don't dedupe
+        asset_start = len(strings.strings)
+        for asset in category['assets']:
+            strings.add(asset, dedupe=False)
+        # Sorting by (name, index) means that a lookup for the first
+        # matching entry will find the lowest index for duplicated names.
+        sorted_start = len(sorted_indexes)
+        sorted_indexes.extend(sorted(range(len(category['assets'])),
+            key=lambda idx: (category['assets'][idx].encode('utf-8'), idx)))
+        categories.append(_category.pack(name_idx,
+            ver_start, len(category['versions']),
+            asset_start, len(category['assets']),
+            sorted_start))
+    (offsets, string_data) = strings.get_parts()
+    return b''.join([
+        _header.pack(MAGIC, FORMAT_VERSION, KIND_SERIAL_DB, src_hash,
+            len(strings.strings), len(categories), len(version_rows)),
+        offsets,
+        _max_version.pack(max_version),
+        b''.join(categories),
+        b''.join(version_rows),
+        b''.join(bit_tables),
+        struct.pack('<{}I'.format(len(sorted_indexes)), *sorted_indexes),
+        string_data,
+        ])
+
+def validate_mapping(compiled, mapping):
+    """
+    Checks that the `CompiledMapping` `compiled` contains exactly the same
+    data as `mapping`, raising an Exception if not.
+    """
+    if len(compiled) != len(mapping):
+        raise Exception('Compiled mapping has {} entries, expected {}'.format(len(compiled), len(mapping)))
+    for key, value in mapping.items():
+        if compiled.get(key) != value:
+            raise Exception('Compiled mapping has the wrong value for {}'.format(key))
+
+def validate_serial_db(compiled, db):
+    """
+    Checks that the `CompiledSerialDB` `compiled` contains exactly the same
+    data as `db`, and that its precomputed bit tables and name lookups are
+    correct, raising an Exception if not.
+    """
+    if set(compiled.keys()) != set(db.keys()):
+        raise Exception('Compiled serial DB categories do not match')
+    max_version = max([max([v['version'] for v in category['versions']]) for category in db.values()])
+    if compiled.max_version != max_version:
+        raise Exception('Compiled serial DB max version is {}, expected {}'.format(compiled.max_version, max_version))
+    for name, category in db.items():
+        if compiled[name]['versions'] != category['versions']:
+            raise Exception('Compiled serial DB versions do not match for {}'.format(name))
+        if list(compiled[name]['assets']) != category['assets']:
+            raise Exception('Compiled serial DB assets do not match for {}'.format(name))
+        if compiled.get_bit_table(name) != compute_bit_table(category['versions'], max_version):
+            raise Exception('Compiled serial DB bit table does not match for {}'.format(name))
+        first_idx = {}
+        for idx, asset in enumerate(category['assets'], start=1):
+            if asset not in first_idx:
+                first_idx[asset] = idx
+        for asset, idx in first_idx.items():
+            if compiled.find_asset(name, asset) != idx:
+                raise Exception('Compiled serial DB lookup failed for {} in {}'.format(asset, name))
+        if compiled.find_asset(name, '') is not None:
+            raise Exception('Compiled serial DB lookup for a missing asset succeeded in {}'.format(name))
+
+def diff_serial_dbs(old_db, new_db):
+    """
+    Compares two versions of the inventory serial DB, returning a list of
+    strings describing the differences: added/removed categories, new serial
+    versions and bit width changes, and added/removed assets.  (The game
+    should only ever append assets, since the indexes are baked into item
+    serials, so removed or reordered assets are worth knowing about.)
+    """
+    report = []
+    for name in sorted(new_db.keys() - old_db.keys()):
+        report.append('New category: {} ({} assets)'.format(name, len(new_db[name]['assets'])))
+    for name in sorted(old_db.keys() - new_db.keys()):
+        report.append('Removed category: {}'.format(name))
+    for name in sorted(new_db.keys() & old_db.keys()):
+        old_cat = old_db[name]
+        new_cat = new_db[name]
+        old_versions = {v['version']: v['bits'] for v in old_cat['versions']}
+        for version in new_cat['versions']:
+            if version['version'] not in old_versions:
+                report.append('{}: new version {} ({} bits)'.format(name, version['version'], version['bits']))
+            elif old_versions[version['version']] != version['bits']:
+                report.append('{}: version {} changed from {} to {} bits'.format(
+                    name, version['version'], old_versions[version['version']], version['bits']))
+        new_versions = {v['version'] for v in new_cat['versions']}
+        for version in sorted(old_versions.keys() - new_versions):
+            report.append('{}: removed version {}'.format(name, version))
+        old_assets = old_cat['assets']
+        new_assets = new_cat['assets']
+        common = 0
+        while common < min(len(old_assets), len(new_assets)) and old_assets[common] == new_assets[common]:
+            common += 1
+        if common < len(old_assets):
+            report.append('{}: WARNING: existing assets changed starting at index {}'.format(name, common+1))
+        for idx in range(common, len(new_assets)):
+            report.append('{}: new asset {}: {}'.format(name, idx+1, new_assets[idx]))
+    return report
+
+def write_file(filename, data):
+    """
+    Writes `data` to `filename` by way of a temporary file which is then
+    renamed into place.  Processes which already have the old file mmapped
+    (see `load`) will keep seeing the old data, rather than having it
+    change out from under them.
+    """
+    temp_file = '{}.{}.tmp'.format(filename, os.getpid())
+    try:
+        with open(temp_file, 'wb') as df:
+            df.write(data)
+        os.replace(temp_file, filename)
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
+def compile_resource(resource_dir, name):
+    """
+    Compiles `<name>.json.xz` in `resource_dir` into `<name>.bin`, validating
+    the compiled data before writing it out.  Returns the filename written.
+    """
+    kind = RESOURCES[name]
+    source_file = os.path.join(resource_dir, '{}.json.xz'.format(name))
+    output_file = os.path.join(resource_dir, '{}.bin'.format(name))
+    with open(source_file, 'rb') as df:
+        source_data = df.read()
+    data = json.loads(lzma.decompress(source_data))
+    if kind == KIND_MAPPING:
+        compiled = compile_mapping(data, source_hash(source_data))
+        validate_mapping(CompiledMapping(compiled), data)
+    else:
+        compiled = compile_serial_db(data, source_hash(source_data))
+        validate_serial_db(CompiledSerialDB(compiled), data)
+    write_file(output_file, compiled)
+    return output_file
+
+def main():
+
+    parser = argparse.ArgumentParser(
+            description='Compile BL3 save editor data files',
+            )
+
+    parser.add_argument('-d', '--directory',
+            default=os.path.join(os.path.dirname(__file__), 'resources'),
+            help='Directory containing the .json.xz data files',
+            )
+
+    parser.add_argument('name',
+            nargs='*',
+            help='Data files to compile (defaults to all of them: {})'.format(
+                ', '.join(sorted(RESOURCES.keys()))),
+            )
+
+    args = parser.parse_args()
+    if not args.name:
+        args.name = sorted(RESOURCES.keys())
+    for name in args.name:
+        if name not in RESOURCES:
+            parser.error('Unknown data file: {}'.format(name))
+
+    for name in args.name:
+        print('Wrote {}'.format(compile_resource(args.directory, name)))
+
+if __name__ == '__main__':
+    main()
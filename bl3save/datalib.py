@@ -22,15 +22,207 @@
 # 3. This notice may not be removed or altered from any source distribution.
 
 import io
+import os
+import sys
 import json
 import lzma
+import mmap
+import pickle
+import time
 import struct
+import pathlib
 import base64
 import random
+import hashlib
 import binascii
+import threading
+import itertools
 import importlib.resources
+import collections.abc
 
-from . import *
+from . import (
+        anointable_invdata_lower_types,
+        mayhem_invdata_lower_types, mayhem_lvl_to_part, mayhem_part_lower_to_lvl,
+        )
+from . import __version__
+from . import compileddb
+
+def _get_resource(filename, resource_dir=None):
+    """
+    Returns an `importlib.resources` Traversable for the given `filename`
+    inside our `resources` directory, or a `pathlib.Path` inside
+    `resource_dir`, if that's been specified.
+    """
+    if resource_dir is not None:
+        return pathlib.Path(resource_dir) / filename
+    return importlib.resources.files(__package__).joinpath('resources/{}'.format(filename))
+
+def get_resource_hashes(resource_dir=None):
+    """
+    Returns a dict containing the hash of each of our source data files as
+    they currently exist on disk (in `resource_dir`, if specified), keyed
+    by the `DataWrapper` attribute which uses it.  Compare this against
+    `DataWrapper.get_source_hashes` to see if a `DataWrapper` is out of date.
+    """
+    hashes = {}
+    for attr, (name, _, _) in _datawrapper_resources.items():
+        source_data = _get_resource('{}.json.xz'.format(name), resource_dir).read_bytes()
+        hashes[attr] = compileddb.source_hash(source_data)
+    return hashes
+
+def _get_cache_dir():
+    """
+    Returns the directory we use to cache decompressed data files, following
+    the XDG Base Directory spec.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'bl3-cli-saveedit')
+
+class LazyAssetList(collections.abc.Sequence):
+    """
+    A read-only list of `count` assets for a single serial DB category,
+    which won't actually be loaded until something in it is requested.
+    `loader` will be called (with no arguments) to get the real list.
+    """
+
+    def __init__(self, count, loader):
+        self.count = count
+        self.loader = loader
+        self.assets = None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if self.assets is None:
+            self.assets = self.loader()
+        return self.assets[idx]
+
+def _read_resource_cache(cache_file, cache_key, kind):
+    """
+    Reads our cached copy of a data file from `cache_file`, returning `None`
+    if it doesn't exist or doesn't match `cache_key`.  Mappings are cached
+    as a single pickle.  The serial DB is cached as a length-prefixed pickled
+    index (containing the version info for each category), followed by a
+    separate pickle of each category's assets, so that we only have to
+    unpickle the categories which actually get used.
+    """
+    if kind == compileddb.KIND_SERIAL_DB:
+        with open(cache_file, 'rb') as df:
+            buf = mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ)
+        (index_size,) = struct.unpack_from('<I', buf, 0)
+        (file_key, index) = pickle.loads(buf[4:4+index_size])
+        if file_key != cache_key:
+            return None
+        base = 4+index_size
+        data = {}
+        for category_name, category in index.items():
+            start = base+category['offset']
+            end = start+category['size']
+            data[category_name] = {
+                    'versions': category['versions'],
+                    'assets': LazyAssetList(category['count'],
+                        lambda start=start, end=end: pickle.loads(buf[start:end])),
+                    }
+        return data
+    else:
+        with open(cache_file, 'rb') as df:
+            (file_key, data) = pickle.load(df)
+        if file_key != cache_key:
+            return None
+        return data
+
+def _write_resource_cache(cache_file, cache_key, data, kind):
+    """
+    Writes out a cached copy of a data file to `cache_file`, in the format
+    described in `_read_resource_cache`.
+    """
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    temp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+    with open(temp_file, 'wb') as df:
+        if kind == compileddb.KIND_SERIAL_DB:
+            index = {}
+            blobs = []
+            offset = 0
+            for category_name, category in data.items():
+                blob = pickle.dumps(category['assets'], protocol=pickle.HIGHEST_PROTOCOL)
+                index[category_name] = {
+                        'versions': category['versions'],
+                        'count': len(category['assets']),
+                        'offset': offset,
+                        'size': len(blob),
+                        }
+                blobs.append(blob)
+                offset += len(blob)
+            index_data = pickle.dumps((cache_key, index), protocol=pickle.HIGHEST_PROTOCOL)
+            df.write(struct.pack('<I', len(index_data)))
+            df.write(index_data)
+            for blob in blobs:
+                df.write(blob)
+        else:
+            pickle.dump((cache_key, data), df, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, cache_file)
+
+def _load_cached_resource(name, source_data, kind):
+    """
+    Loads the data file `name` (whose `.json.xz` contents are `source_data`),
+    using a pickled copy in our cache directory if we've got an up-to-date
+    one.  Otherwise the JSON will be parsed and the cache written out for
+    next time.  Problems reading or writing the cache are ignored; it's just
+    a speedup.
+    """
+    cache_key = (compileddb.source_hash(source_data), __version__)
+    cache_file = os.path.join(_get_cache_dir(), '{}.pickle'.format(name))
+    try:
+        data = _read_resource_cache(cache_file, cache_key, kind)
+        if data is not None:
+            return data
+    except Exception:
+        pass
+
+    with lzma.open(io.BytesIO(source_data)) as df:
+        data = json.load(df)
+
+    try:
+        _write_resource_cache(cache_file, cache_key, data, kind)
+    except Exception:
+        pass
+
+    return data
+
+def _get_compiled_resource(name, kind, resource_dir=None):
+    """
+    Returns the compiled form of the data file `name` (see the `compileddb`
+    module), as a buffer.  The shipped `.bin` file will be used if it's
+    up to date, otherwise the data will be compiled from the `.json.xz`.
+    """
+    source_data = _get_resource('{}.json.xz'.format(name), resource_dir).read_bytes()
+    data = compileddb.load(_get_resource('{}.bin'.format(name), resource_dir), source_data, kind)
+    if data is not None:
+        return data.buf
+    data = _load_cached_resource(name, source_data, kind)
+    if kind == compileddb.KIND_SERIAL_DB:
+        return compileddb.compile_serial_db(data, compileddb.source_hash(source_data))
+    else:
+        return compileddb.compile_mapping(data, compileddb.source_hash(source_data))
+
+def _load_resource(name, kind, resource_dir=None):
+    """
+    Loads the data file `name` from our `resources` directory (or from
+    `resource_dir`, if specified).  If there's an up-to-date compiled version
+    of the file, that'll be used (see the `compileddb` module), otherwise
+    we'll read in the `.json.xz` version (via a cache in the user's cache
+    directory, if possible).  Either way, the serial DB's per-category asset
+    lists are only loaded on demand.  Returns a tuple containing the data
+    and the hash of the source file it came from.
+    """
+    source_data = _get_resource('{}.json.xz'.format(name), resource_dir).read_bytes()
+    data = compileddb.load(_get_resource('{}.bin'.format(name), resource_dir), source_data, kind)
+    if data is None:
+        data = _load_cached_resource(name, source_data, kind)
+    return (data, compileddb.source_hash(source_data))
 
 class ArbitraryBits(object):
     """
@@ -79,6 +271,16 @@ class ArbitraryBits(object):
         value_txt = ''.join([f'{d:08b}' for d in value_data])
         self.data = value_txt[-bits:] + self.data
 
+    def append_values(self, values, bits):
+        """
+        Feeds all of the given `values` to the end of the data, in order,
+        using `bits` bits for each one.  Equivalent to calling `append_value`
+        for each, but builds the new data in a single pass.
+        """
+        if not values:
+            return
+        self.data = ''.join([f'{v:032b}'[-bits:] for v in reversed(values)]) + self.data
+
     def append_data(self, new_data):
         """
         Appends the given `new_data` (from another ArbitraryBits object)
@@ -105,8 +307,30 @@ class BL3Serial(object):
     """
     Class to handle serializing and deserializing BL3 item/weapon serial
     numbers.
+
+    We use `__slots__` here (and in our subclasses) because it's not unusual
+    for tools to have tens of thousands of these in memory at once, and the
+    per-object `__dict__` overhead adds up quickly.  Parts are stored purely
+    as their numerical indexes; names get resolved through the serial DB
+    only when we actually need them.
     """
 
+    __slots__ = (
+            'datawrapper', 'serial_db', 'name_db', 'invkey_db',
+            'serial', 'decrypted_serial', 'orig_seed', 'serial_version',
+            'parsed', 'parts_parsed', 'can_parse', 'can_parse_parts', 'changed_parts',
+            '_version',
+            '_balance_bits', '_balance_idx', '_balance', '_balance_short', '_eng_name',
+            '_invdata_bits', '_invdata_idx', '_invdata',
+            '_manufacturer_bits', '_manufacturer_idx', '_manufacturer',
+            '_level', '_rerolled', '_remaining_data',
+            '_part_invkey', '_part_bits', '_parts',
+            '_generic_bits', '_generic_parts',
+            '_additional_data', '_num_customs',
+            '_serial_number_cache', '_serial_base64_cache',
+            '_identity',
+            )
+
     def __init__(self, serial, datawrapper):
 
         self.datawrapper = datawrapper
@@ -162,9 +386,34 @@ class BL3Serial(object):
         self._additional_data = None
         self._num_customs = None
 
+        # Encoded forms of the serial, as requested via `get_serial_number`
+        # and `get_serial_base64`, keyed by whether or not the original seed
+        # was used.
+        self._serial_number_cache = {}
+        self._serial_base64_cache = {}
+
+        # Seed-independent identity hash, computed on demand
+        self._identity = None
+
         # Call out to any superclass procedures here
         self._update_superclass_serial()
 
+    @property
+    def identity(self):
+        """
+        Returns a seed-independent identity for this item, as a hex string.
+        This is a hash of the serial version plus the decrypted serial data,
+        so the same item obfuscated with two different seeds (such as the
+        original savegame seed vs. the seed-0 `BL3()` codes that we export)
+        will have the same identity.  Useful for duplicate detection.
+        """
+        if self._identity is None:
+            self._identity = hashlib.blake2b(
+                    bytes([self.serial_version]) + bytes(self.decrypted_serial),
+                    digest_size=16,
+                    ).hexdigest()
+        return self._identity
+
     @staticmethod
     def _xor_data(data, seed):
         """
@@ -268,45 +517,47 @@ class BL3Serial(object):
         # Return the freshly-encrypted item
         return header + BL3Serial._bogoencrypt(checksum + data, seed)
 
-    def _get_inv_db_header_part(self, category, bits):
+    def _get_inv_db_header_part(self, num_bits, assets, bits):
         """
-        Given the category name `category`, and the ArbitraryBits object `bits`,
-        containing serial number data, return a tuple containing:
+        Given the number of bits `num_bits` used by a category, that category's
+        list of `assets`, and the ArbitraryBits object `bits`, containing serial
+        number data, return a tuple containing:
             1) The category value
             2) The number of bits the category takes up
             3) The numerical index of the value
-        This relies on being run during `_parse_serial`, so that `_version` is
-        populated in our object.
+        Both `num_bits` and `assets` should come from a `SerialDecodePlan`.
         """
-        num_bits = self.serial_db.get_num_bits(category, self._version)
         part_idx = bits.eat(num_bits)
-        part_val = self.serial_db.get_part(category, part_idx)
-        if not part_val:
+        if 0 < part_idx <= len(assets):
+            part_val = assets[part_idx-1]
+        else:
             part_val = 'unknown'
         return (part_val, num_bits, part_idx)
 
-    def _get_inv_db_header_part_repeated(self, category, bits, count_bits):
+    def _get_inv_db_header_part_repeated(self, num_bits, bits, count_bits):
         """
-        Given the category name `category` and the ArbitraryBits object `bits`,
-        containing serial number data, and `count_bits`, which specifies the
-        number of bits which make up the count of parts to read, returns a
-        tuple containing:
+        Given the number of bits `num_bits` used by each part in a category,
+        the ArbitraryBits object `bits`, containing serial number data, and
+        `count_bits`, which specifies the number of bits which make up the
+        count of parts to read, returns a tuple containing:
             1) The number of bits each part in the category takes up
-            2) A list containing tuples with the following:
-                1) The part name
-                2) The numerical index of the part
+            2) A list containing the numerical indexes of the parts.  Names
+               can be looked up with `serial_db.get_part` if needed.
         """
-        num_bits = self.serial_db.get_num_bits(category, self._version)
-        parts = []
         num_parts = bits.eat(count_bits)
-        for _ in range(num_parts):
-            part_idx = bits.eat(num_bits)
-            part_val = self.serial_db.get_part(category, part_idx)
-            if not part_val:
-                part_val = 'unknown'
-            parts.append((part_val, part_idx))
+        parts = [bits.eat(num_bits) for _ in range(num_parts)]
         return (num_bits, parts)
 
+    def _get_generic_part_lower(self, part_idx):
+        """
+        Returns the lowercased name of the generic part (anointment/mayhem)
+        at index `part_idx`, or `unknown` if we don't know about it.
+        """
+        part_val = self.serial_db.get_part('InventoryGenericPartData', part_idx)
+        if not part_val:
+            return 'unknown'
+        return part_val.lower()
+
     def _parse_serial(self):
         """
         Parse our serial number, at least up to the level.  We're not going
@@ -328,16 +579,21 @@ class BL3Serial(object):
             self.can_parse_parts = False
             return
 
-        # Now the rest of the data we care about.
+        # Now the rest of the data we care about.  All the bit widths and asset
+        # lists for this serial version get computed once and cached by the DB.
+        plan = self.serial_db.get_decode_plan(self._version)
         (self._balance,
                 self._balance_bits,
-                self._balance_idx) = self._get_inv_db_header_part('InventoryBalanceData', bits)
+                self._balance_idx) = self._get_inv_db_header_part(
+                        plan.balance_bits, plan.balance_assets, bits)
         (self._invdata,
                 self._invdata_bits,
-                self._invdata_idx) = self._get_inv_db_header_part('InventoryData', bits)
+                self._invdata_idx) = self._get_inv_db_header_part(
+                        plan.invdata_bits, plan.invdata_assets, bits)
         (self._manufacturer,
                 self._manufacturer_bits,
-                self._manufacturer_idx) = self._get_inv_db_header_part('ManufacturerData', bits)
+                self._manufacturer_idx) = self._get_inv_db_header_part(
+                        plan.manufacturer_bits, plan.manufacturer_assets, bits)
         self._level = bits.eat(7)
 
         # Parse out a "short" balance name, for convenience's sake
@@ -363,14 +619,15 @@ class BL3Serial(object):
 
             # Let's assume at first that we're going to correctly parse all this
             self.parts_parsed = True
+            plan = self.serial_db.get_decode_plan(self._version, self._part_invkey)
 
             # Read parts
             (self._part_bits, self._parts) = self._get_inv_db_header_part_repeated(
-                    self._part_invkey, bits, 6)
+                    plan.part_bits, bits, 6)
 
             # Read generics (anointments+mayhem)
             (self._generic_bits, self._generic_parts) = self._get_inv_db_header_part_repeated(
-                    'InventoryGenericPartData', bits, 4)
+                    plan.generic_bits, bits, 4)
 
             # Read additional data (no idea for the most part; some item "wear"
             # is in here, we think.  Maybe other stuff, too?)
@@ -435,12 +692,13 @@ class BL3Serial(object):
             # changing as little as possible when doing these edits, and this
             # way we can do stuff like change the level of an item without
             # having to re-encode its parts.
-            self._version = self.serial_db.max_version
-            self._balance_bits = self.serial_db.get_num_bits('InventoryBalanceData', self._version)
-            self._invdata_bits = self.serial_db.get_num_bits('InventoryData', self._version)
-            self._manufacturer_bits = self.serial_db.get_num_bits('ManufacturerData', self._version)
-            self._part_bits = self.serial_db.get_num_bits(self._part_invkey, self._version)
-            self._generic_bits = self.serial_db.get_num_bits('InventoryGenericPartData', self._version)
+            plan = self.serial_db.get_decode_plan(self.serial_db.max_version, self._part_invkey)
+            self._version = plan.version
+            self._balance_bits = plan.balance_bits
+            self._invdata_bits = plan.invdata_bits
+            self._manufacturer_bits = plan.manufacturer_bits
+            self._part_bits = plan.part_bits
+            self._generic_bits = plan.generic_bits
 
         # Construct a new header
         bits = ArbitraryBits()
@@ -457,18 +715,15 @@ class BL3Serial(object):
         if self.changed_parts:
             # If we've changed parts, just write out everything again.  First parts
             bits.append_value(len(self._parts), 6)
-            for (part_val, part_idx) in self._parts:
-                bits.append_value(part_idx, self._part_bits)
+            bits.append_values(self._parts, self._part_bits)
 
             # Then generics
             bits.append_value(len(self._generic_parts), 4)
-            for (part_val, part_idx) in self._generic_parts:
-                bits.append_value(part_idx, self._generic_bits)
+            bits.append_values(self._generic_parts, self._generic_bits)
 
             # Then additional data
             bits.append_value(len(self._additional_data), 8)
-            for value in self._additional_data:
-                bits.append_value(value, 8)
+            bits.append_values(self._additional_data, 8)
 
             # Then our number of customs (should always be zero)
             bits.append_value(self._num_customs, 4)
@@ -560,26 +815,71 @@ class BL3Serial(object):
         self._deparse_serial()
         self._update_superclass_serial()
 
+    @property
+    def version(self):
+        """
+        Returns the inventory serial DB version this item was encoded with
+        (not to be confused with `serial_version`, the version of the serial
+        format itself), or `None` if the serial can't be parsed.
+        """
+        if not self.parsed:
+            self._parse_serial()
+            if not self.can_parse:
+                return None
+        return self._version
+
+    def upgrade_serial(self):
+        """
+        Re-encodes this item using the latest serial DB version that we know
+        about, so that future part edits don't have to recompute all the bit
+        widths.  Returns `True` if the item was upgraded (or was already at
+        the latest version), or `False` if we're unable to parse the item's
+        parts and therefore can't re-encode it.
+        """
+        if not self.parsed:
+            self._parse_serial()
+        if not self.can_parse:
+            return False
+        if self._version == self.serial_db.max_version:
+            return True
+        if not self.can_parse_parts:
+            return False
+
+        # Trigger a full re-encode of the serial
+        self.changed_parts = True
+        self._deparse_serial()
+        self._update_superclass_serial()
+        return True
+
     def get_serial_number(self, orig_seed=False):
         """
         Returns the binary item serial number.  If `orig_seed` is `True`, the
         serial number will use the same seed that was used in the savegame.
         Otherwise, it will use a seed of `0`, which will then be unencrypted.
+        The result is cached until the serial changes.
         """
-        if orig_seed:
-            seed = self.orig_seed
-        else:
-            seed = 0
-        return BL3Serial._encrypt_serial(self.decrypted_serial, self.serial_version, seed)
+        orig_seed = bool(orig_seed)
+        if orig_seed not in self._serial_number_cache:
+            if orig_seed:
+                seed = self.orig_seed
+            else:
+                seed = 0
+            self._serial_number_cache[orig_seed] = BL3Serial._encrypt_serial(
+                    self.decrypted_serial, self.serial_version, seed)
+        return self._serial_number_cache[orig_seed]
 
     def get_serial_base64(self, orig_seed=False):
         """
         Returns the base64-encoded item serial number.  If `orig_seed` is
         `True`, the serial number will use the same seed that was used in the
         savegame.  Otherwise, it will use a seed of `0`, which will then be
-        unencrypted.
+        unencrypted.  The result is cached until the serial changes.
         """
-        return 'BL3({})'.format(base64.b64encode(self.get_serial_number(orig_seed)).decode('latin1'))
+        orig_seed = bool(orig_seed)
+        if orig_seed not in self._serial_base64_cache:
+            self._serial_base64_cache[orig_seed] = 'BL3({})'.format(
+                    base64.b64encode(self.get_serial_number(orig_seed)).decode('latin1'))
+        return self._serial_base64_cache[orig_seed]
 
     @staticmethod
     def decode_serial_base64(new_data):
@@ -591,6 +891,32 @@ class BL3Serial(object):
         encoded = new_data[4:-1]
         return base64.b64decode(encoded)
 
+    @staticmethod
+    def validate_serial_base64(new_data):
+        """
+        Checks that the `BL3()`-encoded item serial `new_data` looks valid,
+        without creating an item object or touching any of our data files.
+        This checks the base64 encoding, the serial header, and the checksum
+        stored in the serial.  Returns `None` if the serial is valid, or a
+        string describing the problem otherwise.
+        """
+        try:
+            serial = BL3Serial.decode_serial_base64(new_data)
+        except Exception as e:
+            return 'Could not decode: {}'.format(e)
+        # Version (1) + seed (4) + checksum (2) + at least one byte of data
+        if len(serial) < 8:
+            return 'Serial is too short ({} bytes)'.format(len(serial))
+        if serial[0] != 3 and serial[0] != 4:
+            return 'Unknown serial version: {}'.format(serial[0])
+        try:
+            (decrypted, _, _) = BL3Serial._decrypt_serial(serial)
+        except Exception as e:
+            return str(e)
+        if len(decrypted) == 0 or decrypted[0] != 128:
+            return 'Unknown serial data header'
+        return None
+
     @property
     def mayhem_level(self):
         """
@@ -608,9 +934,10 @@ class BL3Serial(object):
         # to stack at all, so doing so would be pointless).  We'll just
         # abort processing as soon as we find one, which I suspect is likely
         # what the game does, too.
-        for part_name, part_idx in self._generic_parts:
-            if part_name.lower() in mayhem_part_lower_to_lvl:
-                return mayhem_part_lower_to_lvl[part_name.lower()]
+        for part_idx in self._generic_parts:
+            part_lower = self._get_generic_part_lower(part_idx)
+            if part_lower in mayhem_part_lower_to_lvl:
+                return mayhem_part_lower_to_lvl[part_lower]
         return 0
 
     def can_have_mayhem(self):
@@ -653,9 +980,9 @@ class BL3Serial(object):
 
         # First grab a list of any non-Mayhem parts (should just be anoints)
         new_parts = []
-        for idx, (part_name, part_idx) in enumerate(self._generic_parts):
-            if part_name.lower() not in mayhem_part_lower_to_lvl:
-                new_parts.append((part_name, part_idx))
+        for part_idx in self._generic_parts:
+            if self._get_generic_part_lower(part_idx) not in mayhem_part_lower_to_lvl:
+                new_parts.append(part_idx)
 
         # Now add our new one in
         if value > 0:
@@ -666,7 +993,7 @@ class BL3Serial(object):
             if new_mayhem_part is None:
                 return False
             else:
-                new_parts.append((mayhem_lvl_to_part[value], new_mayhem_part))
+                new_parts.append(new_mayhem_part)
 
         # Aaaand assign our list of generic parts back
         self._generic_parts = new_parts
@@ -714,13 +1041,13 @@ class BL3Serial(object):
         self.changed_parts = True
 
         # Start out with our new anointment part
-        new_parts = [(anointment, new_anointment_part)]
+        new_parts = [new_anointment_part]
 
         # Now add in any existing Mayhem parts (should just be the one, but
         # whatever)
-        for idx, (part_name, part_idx) in enumerate(self._generic_parts):
-            if part_name.lower() in mayhem_part_lower_to_lvl:
-                new_parts.append((part_name, part_idx))
+        for part_idx in self._generic_parts:
+            if self._get_generic_part_lower(part_idx) in mayhem_part_lower_to_lvl:
+                new_parts.append(part_idx)
 
         # Aaaand assign our list of generic parts back
         self._generic_parts = new_parts
@@ -732,6 +1059,29 @@ class BL3Serial(object):
         # return!
         return True
 
+    def get_balance_index(self):
+        """
+        Returns the serial DB index of this item's balance, or `None` if the
+        serial can't be parsed.  If the serial hasn't already been parsed, we
+        only decode as far as the balance, which makes this a cheap way to
+        pre-filter items (see `ItemNameIndex.find_items`).
+        """
+        if self.parsed:
+            return self._balance_idx
+        if not self.can_parse:
+            return None
+        bits = ArbitraryBits(self.decrypted_serial)
+        try:
+            if bits.eat(8) != 128:
+                return None
+            version = bits.eat(7)
+            if version > self.serial_db.max_version:
+                return None
+            return bits.eat(self.serial_db.get_num_bits('InventoryBalanceData', version))
+        except Exception:
+            # Truncated or otherwise corrupt serial
+            return None
+
     def get_level_eng(self):
         """
         Returns an English representation of our level, including Mayhem level,
@@ -752,33 +1102,111 @@ class BL3Serial(object):
         else:
             return to_ret
 
+class SerialDecodePlan(object):
+    """
+    Precomputed bit widths and asset lists required to decode (or re-encode)
+    a serial of a specific serial `version`.  If `part_invkey` is given, the
+    plan will also include the bit width for that part category.  These
+    should be retrieved via `InventorySerialDB.get_decode_plan`, which caches
+    them, rather than being constructed directly.
+    """
+
+    __slots__ = (
+            'version',
+            'balance_bits', 'balance_assets',
+            'invdata_bits', 'invdata_assets',
+            'manufacturer_bits', 'manufacturer_assets',
+            'part_invkey', 'part_bits',
+            'generic_bits',
+            )
+
+    def __init__(self, serial_db, version, part_invkey=None):
+        bits = serial_db.bits_for(version)
+        self.version = version
+        self.balance_bits = bits['InventoryBalanceData']
+        self.balance_assets = serial_db.get_assets('InventoryBalanceData')
+        self.invdata_bits = bits['InventoryData']
+        self.invdata_assets = serial_db.get_assets('InventoryData')
+        self.manufacturer_bits = bits['ManufacturerData']
+        self.manufacturer_assets = serial_db.get_assets('ManufacturerData')
+        self.part_invkey = part_invkey
+        if part_invkey is None:
+            self.part_bits = None
+        else:
+            self.part_bits = bits[part_invkey]
+        self.generic_bits = bits['InventoryGenericPartData']
+
 class InventorySerialDB(object):
     """
     Little wrapper to provide access to our inventory serial number DB
     """
 
-    def __init__(self):
+    def __init__(self, resource_dir=None):
         self.initialized = False
+        self.resource_dir = resource_dir
+        self.source_hash = None
         self.db = None
         self._max_version = -1
         self.part_cache = {}
+        self.decode_plans = {}
+        self.bit_tables = {}
+        self.version_bits = {}
+        self.load_time = None
+        self._lock = threading.Lock()
 
     def _initialize(self):
         """
         Actually read in our data.  Not doing this automatically because I
         only want to do it if we're doing an operation which requires it.
+        Safe to call from multiple threads; the data will only be read once.
         """
         if not self.initialized:
-            with lzma.open(io.BytesIO(importlib.resources.files(__name__).joinpath(
-                    'resources/inventoryserialdb.json.xz').read_bytes()
-                    )) as df:
-                self.db = json.load(df)
+            with self._lock:
+                if self.initialized:
+                    return
+                start_time = time.perf_counter()
+                (db, self.source_hash) = _load_resource('inventoryserialdb',
+                        compileddb.KIND_SERIAL_DB, self.resource_dir)
+                self._set_db(db)
+                self.load_time = time.perf_counter() - start_time
+                self.initialized = True
+
+    def set_data(self, db):
+        """
+        Use the already-loaded `db` (either the parsed JSON data or a
+        `compileddb.CompiledSerialDB`) rather than reading in our data file.
+        """
+        with self._lock:
+            self._set_db(db)
+            self.source_hash = getattr(db, 'source_hash', None)
             self.initialized = True
 
+    def _set_db(self, db):
+        """
+        Sets `db` as our data, and computes anything else we need from it.
+        """
+        self.db = db
+        if isinstance(self.db, compileddb.CompiledSerialDB):
+            # The compiled DB has all this precomputed already
+            self._max_version = self.db.max_version
+            for category_name in self.db:
+                self.bit_tables[category_name] = self.db.get_bit_table(category_name)
+        else:
             # I generally shy away from complex one-liners like this, but eh?
             self._max_version = max(
                     [max([v['version'] for v in category['versions']]) for category in self.db.values()]
                     )
+            self._build_bit_tables()
+
+    def _build_bit_tables(self):
+        """
+        Builds a flat list of bit widths for each category, indexed by serial
+        version, so that `get_num_bits` doesn't have to walk the version list
+        every time.
+        """
+        for category_name, category in self.db.items():
+            self.bit_tables[category_name] = compileddb.compute_bit_table(
+                    category['versions'], self._max_version)
 
     @property
     def max_version(self):
@@ -796,13 +1224,51 @@ class InventorySerialDB(object):
         """
         if not self.initialized:
             self._initialize()
-        cur_bits = self.db[category]['versions'][0]['bits']
-        for cat_version in self.db[category]['versions']:
-            if cat_version['version'] > version:
-                return cur_bits
-            elif version >= cat_version['version']:
-                cur_bits = cat_version['bits']
-        return cur_bits
+        table = self.bit_tables[category]
+        if version < len(table):
+            return table[version]
+        else:
+            return table[-1]
+
+    def bits_for(self, version):
+        """
+        Returns a dict containing the number of bits used for every category,
+        using a serial with version `version`
+        """
+        if version not in self.version_bits:
+            self.version_bits[version] = {category: self.get_num_bits(category, version)
+                    for category in self.bit_tables}
+        return self.version_bits[version]
+
+    def get_decode_plan(self, version, part_invkey=None):
+        """
+        Returns a `SerialDecodePlan` for serials of the given `version`,
+        optionally including the part category `part_invkey`.  Plans are
+        only computed once per (version, part_invkey) combination.
+        """
+        key = (version, part_invkey)
+        if key not in self.decode_plans:
+            if not self.initialized:
+                self._initialize()
+            self.decode_plans[key] = SerialDecodePlan(self, version, part_invkey)
+        return self.decode_plans[key]
+
+    def get_categories(self):
+        """
+        Returns a list of all the categories in the DB
+        """
+        if not self.initialized:
+            self._initialize()
+        return list(self.db)
+
+    def get_assets(self, category):
+        """
+        Returns the full list of assets for the specified `category`.  Note
+        that part indexes in serials are 1-based, whereas this list is not.
+        """
+        if not self.initialized:
+            self._initialize()
+        return self.db[category]['assets']
 
     def get_part(self, category, index):
         """
@@ -818,24 +1284,59 @@ class InventorySerialDB(object):
             else:
                 return self.db[category]['assets'][index-1]
 
-    def get_part_index(self, category, part_name):
+    def _get_part_lookup(self, category, case_insensitive=False):
+        """
+        Returns a dict mapping every part name in the given `category` to its
+        index, building it the first time it's requested.  If `case_insensitive`
+        is `True`, the dict keys will be lowercased.  If a name shows up more
+        than once in a category, the first index wins.
+        """
+        key = (category, case_insensitive)
+        if key not in self.part_cache:
+            lookup = {}
+            for idx, asset_part_name in enumerate(self.get_assets(category), start=1):
+                if case_insensitive:
+                    asset_part_name = asset_part_name.lower()
+                if asset_part_name not in lookup:
+                    lookup[asset_part_name] = idx
+            self.part_cache[key] = lookup
+        return self.part_cache[key]
+
+    def get_part_index(self, category, part_name, case_insensitive=False):
         """
         Find the correct index to use for the given `part_name`, inside the given
-        `category`.  Will return `None` if the part cannot be found.
+        `category`.  Will return `None` if the part cannot be found.  If
+        `case_insensitive` is `True`, the part name will be matched regardless
+        of case.
+        """
+        if not self.initialized:
+            self._initialize()
+        if not case_insensitive and isinstance(self.db, compileddb.CompiledSerialDB):
+            # The compiled DB has a precomputed name index
+            return self.db.find_asset(category, part_name)
+        lookup = self._get_part_lookup(category, case_insensitive)
+        if case_insensitive:
+            part_name = part_name.lower()
+        return lookup.get(part_name)
+
+    def get_part_indexes(self, category, part_names, case_insensitive=False):
+        """
+        Find the correct indexes to use for all the given `part_names`, inside
+        the given `category`.  Returns a list of indexes in the same order as
+        `part_names`, with `None` for any part which cannot be found.  If
+        `case_insensitive` is `True`, part names will be matched regardless
+        of case.
         """
         if not self.initialized:
             self._initialize()
-        if category not in self.part_cache:
-            self.part_cache[category] = {}
-        if part_name not in self.part_cache[category]:
-            for idx, asset_part_name in enumerate(self.db[category]['assets']):
-                if part_name == asset_part_name:
-                    self.part_cache[category][part_name] = idx+1
-                    return idx+1
-        if part_name in self.part_cache[category]:
-            return self.part_cache[category][part_name]
+        if not case_insensitive and isinstance(self.db, compileddb.CompiledSerialDB):
+            # The compiled DB has a precomputed name index
+            return [self.db.find_asset(category, part_name) for part_name in part_names]
+        lookup = self._get_part_lookup(category, case_insensitive)
+        if case_insensitive:
+            return [lookup.get(part_name.lower()) for part_name in part_names]
         else:
-            return None
+            return [lookup.get(part_name) for part_name in part_names]
 
 class BalanceToName(object):
     """
@@ -843,35 +1344,80 @@ class BalanceToName(object):
     English names that we can report on.
     """
 
-    def __init__(self):
+    def __init__(self, resource_dir=None):
         self.initialized = False
+        self.resource_dir = resource_dir
+        self.source_hash = None
         self.mapping = None
+        self.load_time = None
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
 
     def _initialize(self):
         """
         Actually read in our data.  Not doing this automatically because I
         only want to do it if we're doing an operation which requires it.
+        Safe to call from multiple threads; the data will only be read once.
         """
         if not self.initialized:
-            with lzma.open(io.BytesIO(importlib.resources.files(__name__).joinpath(
-                    'resources/balance_name_mapping.json.xz').read_bytes()
-                    )) as df:
-                self.mapping = json.load(df)
+            with self._lock:
+                if self.initialized:
+                    return
+                start_time = time.perf_counter()
+                (self.mapping, self.source_hash) = _load_resource('balance_name_mapping',
+                        compileddb.KIND_MAPPING, self.resource_dir)
+                self.load_time = time.perf_counter() - start_time
+                self.initialized = True
+
+    def set_data(self, mapping):
+        """
+        Use the already-loaded `mapping` (either the parsed JSON data or a
+        `compileddb.CompiledMapping`) rather than reading in our data file.
+        """
+        with self._lock:
+            self.mapping = mapping
+            self.source_hash = getattr(mapping, 'source_hash', None)
             self.initialized = True
 
     def get(self, balance):
         """
-        Returns an english mapping for the given balance, if we can.
+        Returns an english mapping for the given balance, if we can.  Results
+        are cached by the balance name we were passed.
         """
+        if balance in self.cache:
+            self.hits += 1
+            return self.cache[balance]
+        self.misses += 1
         if not self.initialized:
             self._initialize()
+        orig_balance = balance
         if '.' in balance:
             balance = balance.rsplit('.', 1)[0]
         balance = balance.lower()
         if balance in self.mapping:
-            return self.mapping[balance]
+            result = self.mapping[balance]
         else:
-            return None
+            result = None
+        self.cache[orig_balance] = result
+        return result
+
+    def items(self):
+        """
+        Returns a list of (normalized balance, english name) tuples for every
+        balance we know about.  The balances are lowercased, without the
+        object name suffix.
+        """
+        if not self.initialized:
+            self._initialize()
+        return list(self.mapping.items())
+
+    def get_cache_stats(self):
+        """
+        Returns a dict containing our cache hit and miss counts
+        """
+        return {'hits': self.hits, 'misses': self.misses}
 
 class BalanceToInvKey(object):
     """
@@ -879,35 +1425,262 @@ class BalanceToInvKey(object):
     the inventory key that we'd need to use to read its parts out.
     """
 
-    def __init__(self):
+    def __init__(self, resource_dir=None):
         self.initialized = False
+        self.resource_dir = resource_dir
+        self.source_hash = None
         self.mapping = None
+        self.load_time = None
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
 
     def _initialize(self):
         """
         Actually read in our data.  Not doing this automatically because I
         only want to do it if we're doing an operation which requires it.
+        Safe to call from multiple threads; the data will only be read once.
         """
         if not self.initialized:
-            with lzma.open(io.BytesIO(importlib.resources.files(__name__).joinpath(
-                    'resources/balance_to_inv_key.json.xz').read_bytes()
-                    )) as df:
-                self.mapping = json.load(df)
+            with self._lock:
+                if self.initialized:
+                    return
+                start_time = time.perf_counter()
+                (self.mapping, self.source_hash) = _load_resource('balance_to_inv_key',
+                        compileddb.KIND_MAPPING, self.resource_dir)
+                self.load_time = time.perf_counter() - start_time
+                self.initialized = True
+
+    def set_data(self, mapping):
+        """
+        Use the already-loaded `mapping` (either the parsed JSON data or a
+        `compileddb.CompiledMapping`) rather than reading in our data file.
+        """
+        with self._lock:
+            self.mapping = mapping
+            self.source_hash = getattr(mapping, 'source_hash', None)
             self.initialized = True
 
     def get(self, balance):
         """
-        Returns the inventory key for the given balance, if we can.
+        Returns the inventory key for the given balance, if we can.  Results
+        are cached by the balance name we were passed.
         """
+        if balance in self.cache:
+            self.hits += 1
+            return self.cache[balance]
+        self.misses += 1
         if not self.initialized:
             self._initialize()
+        orig_balance = balance
         if '.' not in balance:
             balance = '{}.{}'.format(balance, balance.split('/')[-1])
         balance = balance.lower()
         if balance in self.mapping:
-            return self.mapping[balance]
+            result = self.mapping[balance]
         else:
-            return None
+            result = None
+        self.cache[orig_balance] = result
+        return result
+
+    def get_cache_stats(self):
+        """
+        Returns a dict containing our cache hit and miss counts
+        """
+        return {'hits': self.hits, 'misses': self.misses}
+
+class ItemNameIndex(object):
+    """
+    Trigram index over the English item names in `BalanceToName`, used to
+    find items by a fragment of their name without having to fully parse
+    every item.  Name fragments are matched case-insensitively, and only
+    items with an English name can be found.
+    """
+
+    def __init__(self, name_db, serial_db):
+        self.name_db = name_db
+        self.serial_db = serial_db
+        self.initialized = False
+        self.names = None
+        self.trigrams = None
+        self.balance_indexes = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_trigrams(text):
+        """
+        Returns the set of trigrams in `text`
+        """
+        return {text[i:i+3] for i in range(len(text)-2)}
+
+    def _initialize(self):
+        """
+        Builds our index.  Not doing this automatically because I only want
+        to do it if we're doing a search.
+        """
+        if not self.initialized:
+            with self._lock:
+                if self.initialized:
+                    return
+
+                # Names and trigrams, from the name mapping
+                names = {}
+                trigrams = {}
+                for balance, name in self.name_db.items():
+                    name = name.lower()
+                    names[balance] = name
+                    for trigram in self._get_trigrams(name):
+                        trigrams.setdefault(trigram, set()).add(balance)
+
+                # Then map those balances to the indexes used in serials
+                balance_indexes = {}
+                for idx, asset in enumerate(self.serial_db.get_assets('InventoryBalanceData'), start=1):
+                    balance = asset.rsplit('.', 1)[0].lower()
+                    if balance in names:
+                        balance_indexes.setdefault(balance, set()).add(idx)
+
+                self.names = names
+                self.trigrams = trigrams
+                self.balance_indexes = balance_indexes
+                self.initialized = True
+
+    def find_balances(self, fragment):
+        """
+        Returns a set of the (normalized) balances whose English names contain
+        `fragment`.
+        """
+        if not self.initialized:
+            self._initialize()
+        fragment = fragment.lower()
+        if len(fragment) < 3:
+            candidates = self.names.keys()
+        else:
+            candidates = None
+            for trigram in self._get_trigrams(fragment):
+                balances = self.trigrams.get(trigram, set())
+                if candidates is None:
+                    candidates = balances
+                else:
+                    candidates = candidates & balances
+                if not candidates:
+                    return set()
+        return {balance for balance in candidates if fragment in self.names[balance]}
+
+    def find_balance_indexes(self, fragment):
+        """
+        Returns a set of the serial DB balance indexes for items whose English
+        names contain `fragment`.
+        """
+        if not self.initialized:
+            self._initialize()
+        indexes = set()
+        for balance in self.find_balances(fragment):
+            indexes |= self.balance_indexes.get(balance, set())
+        return indexes
+
+    def find_items(self, items, fragment):
+        """
+        Returns a list of the `items` (`BL3Serial` objects) whose English names
+        contain `fragment`.  Items are only decoded as far as their balance,
+        so items which don't match never get fully parsed.
+        """
+        indexes = self.find_balance_indexes(fragment)
+        return [item for item in items if item.get_balance_index() in indexes]
+
+class PathHashIndex(object):
+    """
+    Reverse index from inventory path hashes (as computed by
+    `inventory_path_hash`) back to the object paths they came from, for
+    identifying hashes we don't otherwise know about, such as weapon
+    customizations in profiles which aren't in our own lists.  Covers every
+    asset in the serial DB plus all the customization paths we know about.
+    Building the index means hashing all of those, so it gets saved in our
+    cache directory (keyed by the serial DB it was built from) and reused.
+    """
+
+    def __init__(self, serial_db):
+        self.serial_db = serial_db
+        self.initialized = False
+        self.index = None
+        self.load_time = None
+        self._lock = threading.Lock()
+
+    def _initialize(self):
+        """
+        Loads or builds our index.  Not doing this automatically because I
+        only want to do it if we actually have a hash to look up.
+        """
+        if not self.initialized:
+            with self._lock:
+                if self.initialized:
+                    return
+                start_time = time.perf_counter()
+                if not self.serial_db.initialized:
+                    self.serial_db._initialize()
+                if self.serial_db.source_hash is None:
+                    cache_key = None
+                else:
+                    cache_key = (self.serial_db.source_hash, __version__)
+                cache_file = os.path.join(_get_cache_dir(), 'path_hash_index.pickle')
+                index = None
+                if cache_key is not None:
+                    try:
+                        index = _read_resource_cache(cache_file, cache_key, compileddb.KIND_MAPPING)
+                    except Exception:
+                        pass
+                if index is None:
+                    index = self._build_index()
+                    if cache_key is not None:
+                        try:
+                            _write_resource_cache(cache_file, cache_key, index, compileddb.KIND_MAPPING)
+                        except Exception:
+                            pass
+                self.index = index
+                self.load_time = time.perf_counter() - start_time
+                self.initialized = True
+
+    def _build_index(self):
+        """
+        Hashes all the paths we know about, returning a dict mapping each hash
+        to its path.  If two paths ever hash to the same value, the first one
+        (alphabetically) wins.
+        """
+        # Imported here so that just loading this module doesn't require
+        # building all the customization data
+        from . import _customizations, _hashes
+        paths = set()
+        for category in self.serial_db.get_categories():
+            paths.update(self.serial_db.get_assets(category))
+        paths.update(_customizations.profile_skins)
+        paths.update(_customizations.profile_heads)
+        paths.update(_customizations.profile_echothemes)
+        paths.update(_customizations.profile_emotes)
+        paths.update(_customizations.profile_roomdeco_obj_to_eng.keys())
+        paths.update(_customizations.profile_weaponskins_obj_to_eng.keys())
+        paths.update(_customizations.profile_weapontrinkets_obj_to_eng.keys())
+        paths.update([
+            _hashes.goldenkey_category,
+            _hashes.vaultcard1key_category,
+            _hashes.vaultcard2key_category,
+            _hashes.vaultcard3key_category,
+            _hashes.diamondkey_category,
+            ])
+        paths = sorted(paths)
+        index = {}
+        for path, path_hash in zip(paths, _hashes.inventory_path_hashes(paths)):
+            if path_hash not in index:
+                index[path_hash] = path
+        return index
+
+    def get(self, path_hash):
+        """
+        Returns the object path which hashes to `path_hash`, or `None` if
+        we don't know of one.
+        """
+        if not self.initialized:
+            self._initialize()
+        return self.index.get(path_hash)
 
 class DataWrapper(object):
     """
@@ -916,10 +1689,335 @@ class DataWrapper(object):
     object instance and take what they want, rather than having to carry around
     multiple.  (For instance, BL3Item needs both InventorySerialDB and
     BalanceToName, and we instantiate a fair number of those.)
+
+    Each instance is a snapshot of the data: once loaded, its data never
+    changes, and `snapshot` is a number which is unique (and increasing)
+    for each instance created in this process.  Data files will be read from
+    `resource_dir` if that's specified, rather than our `resources` dir.
+    See `reload_shared_datawrapper` for swapping in updated data at runtime.
+    """
+
+    def __init__(self, resource_dir=None):
+        self.snapshot = next(_snapshot_counter)
+        self.resource_dir = resource_dir
+        self.serial_db = InventorySerialDB(resource_dir)
+        self.name_db = BalanceToName(resource_dir)
+        self.invkey_db = BalanceToInvKey(resource_dir)
+        self.name_index = ItemNameIndex(self.name_db, self.serial_db)
+        self.path_hash_index = PathHashIndex(self.serial_db)
+        self.prefetch_thread = None
+        self.prefetch_start = None
+        self.prefetch_end = None
+        self.shared_memory = []
+
+    def load(self):
+        """
+        Loads all our data right away (rather than waiting until it's first
+        used), raising an exception if anything goes wrong.  Returns this
+        object, for convenience.
+        """
+        self.serial_db._initialize()
+        self.name_db._initialize()
+        self.invkey_db._initialize()
+        return self
+
+    def get_source_hashes(self):
+        """
+        Returns a dict containing the hash of the source data file that each
+        of our data objects was loaded from (or `None` for any which haven't
+        been loaded yet), in the same format as `get_resource_hashes`.
+        """
+        return {
+                'serial_db': self.serial_db.source_hash,
+                'name_db': self.name_db.source_hash,
+                'invkey_db': self.invkey_db.source_hash,
+                }
+
+    def prefetch(self):
+        """
+        Starts loading all our data in a background thread, so that it can
+        happen while the app is busy with something else (such as reading in
+        a savegame).  Anything which needs the data before it's done will
+        just wait for the load to finish.  Calling this more than once has no
+        further effect.
+        """
+        if self.prefetch_thread is None:
+            self.prefetch_thread = threading.Thread(
+                    target=self._prefetch,
+                    name='bl3-data-prefetch',
+                    daemon=True,
+                    )
+            self.prefetch_thread.start()
+
+    def _prefetch(self):
+        """
+        Actually load all our data; called by `prefetch` in a separate thread.
+        """
+        self.prefetch_start = time.perf_counter()
+        try:
+            self.serial_db.get_decode_plan(self.serial_db.max_version)
+            self.name_db._initialize()
+            self.invkey_db._initialize()
+        except Exception:
+            # If something went wrong, the same error will be raised again
+            # in the main thread once the data is actually used.
+            pass
+        self.prefetch_end = time.perf_counter()
+
+    def get_load_times(self):
+        """
+        Returns a dict containing the number of seconds each of our data objects
+        took to load, or `None` for any which haven't been loaded.
+        """
+        return {
+                'serial_db': self.serial_db.load_time,
+                'name_db': self.name_db.load_time,
+                'invkey_db': self.invkey_db.load_time,
+                'path_hash_index': self.path_hash_index.load_time,
+                }
+
+    def get_cache_stats(self):
+        """
+        Returns a dict containing the lookup cache hit and miss counts for
+        each of our data objects which caches lookups.
+        """
+        return {
+                'name_db': self.name_db.get_cache_stats(),
+                'invkey_db': self.invkey_db.get_cache_stats(),
+                }
+
+# Used to number DataWrapper snapshots
+_snapshot_counter = itertools.count(1)
+
+# A process-wide DataWrapper, so that tools which load more than one
+# savegame/profile only have to read in our data files once.
+_shared_datawrapper = None
+_shared_datawrapper_lock = threading.Lock()
+
+def get_shared_datawrapper():
+    """
+    Returns the process-wide `DataWrapper` instance, creating it if need be.
+    This is what `BL3Save` and `BL3Profile` use unless they're given a
+    specific `DataWrapper` to use instead (which is the way to opt out of
+    sharing, such as for tests which want a clean set of data objects).
+    """
+    global _shared_datawrapper
+    if _shared_datawrapper is None:
+        with _shared_datawrapper_lock:
+            if _shared_datawrapper is None:
+                _shared_datawrapper = DataWrapper()
+    return _shared_datawrapper
+
+def reload_shared_datawrapper(resource_dir=None, force=False):
+    """
+    For long-running processes: loads a new `DataWrapper` snapshot from our
+    data files (or the ones in `resource_dir`, if specified) and makes it the
+    process-wide one returned by `get_shared_datawrapper`.  The new snapshot
+    is loaded completely before being swapped in, so anything using the
+    shared `DataWrapper` in the meantime carries on uninterrupted.  Saves,
+    profiles and items which have already been loaded keep using the
+    snapshot they were loaded with; only new work will use the new one.
+
+    Unless `force` is `True`, nothing is reloaded if the current snapshot
+    was loaded from the same data files.  Returns the `DataWrapper` which is
+    now shared.
+    """
+    global _shared_datawrapper
+    current = _shared_datawrapper
+    if not force and current is not None and current.resource_dir == resource_dir:
+        current_hashes = current.get_source_hashes()
+        if None not in current_hashes.values() \
+                and current_hashes == get_resource_hashes(resource_dir):
+            return current
+    datawrapper = DataWrapper(resource_dir).load()
+    with _shared_datawrapper_lock:
+        _shared_datawrapper = datawrapper
+    return datawrapper
+
+class FileCache(object):
+    """
+    Cache of parsed savegames/profiles, so that running a batch of commands
+    on the same files (see `cli_batch`) only has to read, decrypt, and parse
+    each file once.  Entries hold the file's header info and its parsed
+    protobuf message, which callers should copy rather than modify, since
+    each `BL3Save`/`BL3Profile` is free to change its own data.  Entries are
+    keyed by the file's path, modification time and size, so a file which
+    has been changed in the meantime is just read in again, and they're also
+    dropped whenever we write to the file (see `discard`).  Only the most
+    recent `max_files` files are kept.  This is only used if it's been turned
+    on via `enable_file_cache`.
+    """
+
+    def __init__(self, max_files=16):
+        self.max_files = max_files
+        self.files = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(filename):
+        """
+        Returns the cache key for `filename`, as it currently exists on disk.
+        This should be called before the file is read.
+        """
+        stat = os.stat(filename)
+        return (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key):
+        """
+        Returns a tuple containing the header info and parsed protobuf message
+        for the file with the given `key`, or `None` if we don't have it.  The
+        message must not be modified.
+        """
+        with self._lock:
+            if key in self.files:
+                self.hits += 1
+                self.files.move_to_end(key)
+                return self.files[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, header, message):
+        """
+        Stores the `header` info (a dict) and parsed protobuf `message` for the
+        file with the given `key`, replacing any older versions of the same
+        file.  `message` should be a copy which nothing else will modify.
+        """
+        with self._lock:
+            for old_key in [k for k in self.files if k[0] == key[0]]:
+                del self.files[old_key]
+            self.files[key] = (header, message)
+            while len(self.files) > self.max_files:
+                self.files.popitem(last=False)
+
+    def discard(self, filename):
+        """
+        Drops any cached data for `filename`.  This should be called whenever
+        the file gets written to, since the modification time and size alone
+        won't always catch a rewrite (such as on filesystems with coarse
+        modification times).
+        """
+        path = os.path.abspath(filename)
+        with self._lock:
+            for old_key in [k for k in self.files if k[0] == path]:
+                del self.files[old_key]
+
+_file_cache = None
+
+def enable_file_cache(max_files=16):
+    """
+    Turns on caching of decrypted savegame/profile data for this process (see
+    `FileCache`).  Returns the cache.
+    """
+    global _file_cache
+    if _file_cache is None:
+        _file_cache = FileCache(max_files)
+    return _file_cache
+
+def get_file_cache():
+    """
+    Returns the process-wide `FileCache`, or `None` if it's not enabled
+    """
+    return _file_cache
+
+def discard_cached_file(filename):
+    """
+    Drops `filename` from the process-wide `FileCache`, if it's enabled.
+    Called whenever a savegame or profile is about to be written.
+    """
+    if _file_cache is not None:
+        _file_cache.discard(filename)
+
+# The data files used by each of the `DataWrapper` data objects
+_datawrapper_resources = {
+        'serial_db': ('inventoryserialdb', compileddb.KIND_SERIAL_DB, compileddb.CompiledSerialDB),
+        'name_db': ('balance_name_mapping', compileddb.KIND_MAPPING, compileddb.CompiledMapping),
+        'invkey_db': ('balance_to_inv_key', compileddb.KIND_MAPPING, compileddb.CompiledMapping),
+        }
+
+class SharedData(object):
+    """
+    All of our item data, loaded into `multiprocessing.shared_memory` in
+    its compiled form (see the `compileddb` module).  This lets a process
+    pool share a single copy of the data: the parent creates one of these
+    and passes its `handle` to each worker, which calls
+    `attach_shared_datawrapper` (for instance, as a pool's `initializer`).
+    Workers read straight out of the shared memory, without any parsing.
+    Call `close` (or use this as a context manager) once the workers are
+    done, to free the shared memory.
     """
 
     def __init__(self):
-        self.serial_db = InventorySerialDB()
-        self.name_db = BalanceToName()
-        self.invkey_db = BalanceToInvKey()
+        # Only imported when needed, since it takes a while
+        import multiprocessing.shared_memory
+        self.blocks = {}
+        try:
+            for attr, (name, kind, _) in _datawrapper_resources.items():
+                data = _get_compiled_resource(name, kind)
+                block = multiprocessing.shared_memory.SharedMemory(create=True, size=len(data))
+                block.buf[:len(data)] = data
+                self.blocks[attr] = block
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def handle(self):
+        """
+        A picklable value which workers can pass to `attach_shared_datawrapper`
+        """
+        return {attr: block.name for attr, block in self.blocks.items()}
 
+    def close(self):
+        """
+        Frees our shared memory
+        """
+        for block in self.blocks.values():
+            block.close()
+            if sys.version_info < (3, 13) and os.name == 'posix':
+                # Workers which share our resource tracker may have
+                # unregistered the block when attaching (see
+                # `attach_shared_datawrapper`), so make sure it's registered
+                # before `unlink` unregisters it again.
+                import multiprocessing.resource_tracker
+                multiprocessing.resource_tracker.register(block._name, 'shared_memory')
+            block.unlink()
+        self.blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def attach_shared_datawrapper(handle):
+    """
+    Attaches to item data which has been put into shared memory by a
+    `SharedData` object in another process, given its `handle`, and makes
+    that the process-wide `DataWrapper` returned by `get_shared_datawrapper`.
+    Returns the new `DataWrapper`.
+
+    The shared memory is left for the `SharedData` object to clean up, so it
+    isn't unlinked when this process exits.
+    """
+    global _shared_datawrapper
+    import multiprocessing.shared_memory
+    if sys.version_info < (3, 13):
+        import multiprocessing.resource_tracker
+    datawrapper = DataWrapper()
+    for attr, block_name in handle.items():
+        (_, _, cls) = _datawrapper_resources[attr]
+        # The `SharedData` object is responsible for unlinking the blocks, so
+        # don't have the resource tracker keep track of them here.
+        if sys.version_info >= (3, 13):
+            block = multiprocessing.shared_memory.SharedMemory(name=block_name, track=False)
+        else:
+            block = multiprocessing.shared_memory.SharedMemory(name=block_name)
+            if os.name == 'posix':
+                multiprocessing.resource_tracker.unregister(block._name, 'shared_memory')
+        datawrapper.shared_memory.append(block)
+        getattr(datawrapper, attr).set_data(cls(block.buf))
+    with _shared_datawrapper_lock:
+        _shared_datawrapper = datawrapper
+    return datawrapper
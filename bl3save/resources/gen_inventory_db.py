@@ -22,20 +22,32 @@
 # 3. This notice may not be removed or altered from any source distribution.
 
 import io
+import os
+import sys
 import lzma
 import json
 import codecs
 import argparse
 from Crypto.Cipher import AES
 
+# We want the compiled-data code from the main app, too
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from bl3save import compileddb
+
 # Takes InventorySerialNumberDatabase.dat from inside the BL3 paks and turns
-# it into a compressed JSON file suitable for use in our savegame apps.
+# it into a compressed JSON file suitable for use in our savegame apps, along
+# with the compiled version of the same data (see `bl3save/compileddb.py`),
+# which includes precomputed bit-width tables and name indexes.  The compiled
+# version is validated against the JSON before being written.  If there's
+# already a JSON file present, a report of what changed (new assets, bit
+# width changes, etc) will be printed out before it's overwritten.
 # At user request, will also write out a version suitable for sending PRs
 # to https://github.com/gibbed/Borderlands3Dumps
 
 # Input/Output parameters
 input_file = 'InventorySerialNumberDatabase.dat'
 output_file = 'inventoryserialdb.json.xz'
+compiled_file = 'inventoryserialdb.bin'
 gibbed_file = 'Inventory Serial Number Database.json'
 
 ###
@@ -62,6 +74,15 @@ parser.add_argument('-g', '--gibbed',
         action='store_true',
         help='Also generate JSON suitable for sending PRs to Gibbed at https://github.com/gibbed/Borderlands3Dumps')
 
+parser.add_argument('-d', '--diff',
+        type=str,
+        default=output_file,
+        help='Previous JSON data to report changes against (default: {})'.format(output_file))
+
+parser.add_argument('-r', '--report',
+        type=str,
+        help='Also write the change report to this file')
+
 args = parser.parse_args()
 
 ###
@@ -106,11 +127,42 @@ for line in df:
         (uuid, obj_name) = value.split(',', 1)
         top[cur_class]['assets'].append(obj_name)
 
-# Output to compressed JSON
-with lzma.open(output_file, 'wt') as odf:
-    json.dump(top, odf, separators=(',', ':'))
+# Report on what's changed since the previous version, if we have it
+if os.path.exists(args.diff):
+    with lzma.open(args.diff, 'rt') as idf:
+        old_db = json.load(idf)
+    report = compileddb.diff_serial_dbs(old_db, top)
+    print('')
+    print('Changes since {}:'.format(args.diff))
+    if report:
+        for line in report:
+            print(' - {}'.format(line))
+    else:
+        print(' - (none)')
+    if args.report:
+        with open(args.report, 'wt') as odf:
+            for line in report:
+                print(line, file=odf)
+        print('')
+        print('Wrote change report to {}'.format(args.report))
+elif args.report:
+    raise Exception('Cannot generate a change report without previous data: {}'.format(args.diff))
+
+# Build the compressed JSON and the compiled version, and validate the
+# compiled data before writing anything, so that a failure doesn't leave new
+# JSON next to a stale compiled file.
+source_data = lzma.compress(json.dumps(top, separators=(',', ':')).encode('utf-8'))
+compiled = compileddb.compile_serial_db(top, compileddb.source_hash(source_data))
+compileddb.validate_serial_db(compileddb.CompiledSerialDB(compiled), top)
+
+# Files are written out via a rename, so that long-running processes using
+# the old data won't see it change underneath them; they can pick up the new
+# data with `datalib.reload_shared_datawrapper`.
+compileddb.write_file(output_file, source_data)
 print('')
 print('Wrote JSON to {}'.format(output_file))
+compileddb.write_file(compiled_file, compiled)
+print('Wrote compiled data to {}'.format(compiled_file))
 
 # If we've been asked to, also generate a Gibbed-compatible JSON file, so that
 # diffs in that repo are nice and clean.  This is pretty stupidly done, but
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import sys
+import argparse
+
+# We need the data from the main app
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from bl3save import _hashes, _customizations, _pathhashes
+
+# Precomputes the inventory path hashes for all the weapon customizations and
+# key categories that we know about, and writes them out to `_pathhashes.py`
+# in the main app dir, so that they don't have to be computed every time the
+# data is loaded.  This should be re-run whenever any of those paths change.
+# With `-c`/`--check`, nothing is written; instead every hash is recomputed
+# and compared against the current `_pathhashes.py`, exiting with an error
+# if anything's missing or wrong.
+
+# Output parameters
+output_file = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '_pathhashes.py'))
+
+header = """# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+# Autogenerated by resources/gen_path_hashes.py -- don't edit this by hand!
+# Precomputed inventory path hashes (see `_hashes.py`).
+"""
+
+parser = argparse.ArgumentParser(
+        description='Generates precomputed inventory path hashes',
+        )
+
+parser.add_argument('-c', '--check',
+        action='store_true',
+        help='Recompute all hashes and compare them to the current data, rather than writing',
+        )
+
+args = parser.parse_args()
+
+# Collect all the paths we need hashes for
+paths = set()
+paths |= set(_customizations.profile_weaponskins_obj_to_eng.keys())
+paths |= set(_customizations.profile_weapontrinkets_obj_to_eng.keys())
+paths |= set([
+    _hashes.goldenkey_category,
+    _hashes.vaultcard1key_category,
+    _hashes.vaultcard2key_category,
+    _hashes.vaultcard3key_category,
+    _hashes.diamondkey_category,
+    ])
+hashes = {path: _hashes.compute_inventory_path_hash(path) for path in paths}
+
+if args.check:
+    errors = []
+    for path in sorted(paths):
+        if path not in _pathhashes.path_hashes:
+            errors.append('Missing: {}'.format(path))
+        elif _pathhashes.path_hashes[path] != hashes[path]:
+            errors.append('Wrong hash (0x{:08X}, should be 0x{:08X}): {}'.format(
+                _pathhashes.path_hashes[path],
+                hashes[path],
+                path,
+                ))
+    for path in sorted(_pathhashes.path_hashes.keys() - paths):
+        errors.append('Unused: {}'.format(path))
+    if errors:
+        for error in errors:
+            print(error)
+        print('')
+        print('Precomputed hashes are out of date; re-run {} to regenerate them'.format(sys.argv[0]))
+        sys.exit(1)
+    print('All {} precomputed hashes are correct'.format(len(paths)))
+else:
+    with open(output_file, 'w') as odf:
+        print(header, file=odf)
+        print('path_hashes = {', file=odf)
+        for path in sorted(paths):
+            print('        {!r}: 0x{:08X},'.format(path, hashes[path]), file=odf)
+        print('        }', file=odf)
+    print('Wrote {} hashes to {}'.format(len(paths), output_file))
@@ -35,6 +35,9 @@ setup(
                 'resources/inventoryserialdb.json.xz',
                 'resources/balance_name_mapping.json.xz',
                 'resources/balance_to_inv_key.json.xz',
+                'resources/inventoryserialdb.bin',
+                'resources/balance_name_mapping.bin',
+                'resources/balance_to_inv_key.bin',
                 ],
             },
         # We now make use of importlib.resources.files, which was added in 3.9:
@@ -74,6 +77,12 @@ setup(
                 'bl3-profile-info = bl3save.cli_prof_info:main',
                 'bl3-profile-import-protobuf = bl3save.cli_prof_import_protobuf:main',
                 'bl3-profile-import-json = bl3save.cli_prof_import_json:main',
+
+                # Item-related scripts
+                'bl3-items-validate = bl3save.cli_items_validate:main',
+
+                # Runs a batch of the above in a single process
+                'bl3 = bl3save.cli_batch:main',
                 ],
             },
         )
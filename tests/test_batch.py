@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import tempfile
+import unittest
+from bl3save import cli_batch, datalib
+
+class CheckArgsTests(unittest.TestCase):
+    """
+    Tests for the up-front argument checks in the `bl3` batch runner
+    """
+
+    def test_valid(self):
+        self.assertIsNone(cli_batch.check_args('bl3-save-edit',
+            ['-f', '--name', 'Foo', 'in.sav', 'out.sav']))
+
+    def test_help(self):
+        self.assertIsNone(cli_batch.check_args('bl3-save-info', ['--help']))
+
+    def test_invalid(self):
+        error = cli_batch.check_args('bl3-save-edit', ['--bogus', 'in.sav', 'out.sav'])
+        self.assertIn('bl3-save-edit: error:', error)
+        self.assertIn('--bogus', error)
+
+    def test_missing(self):
+        self.assertIsNotNone(cli_batch.check_args('bl3-profile-info', []))
+
+    def test_every_command(self):
+        for command in cli_batch.commands:
+            with self.subTest(command=command):
+                self.assertIsNone(cli_batch.check_args(command, ['--version']))
+
+class FileCacheTests(unittest.TestCase):
+    """
+    Tests for `datalib.FileCache`
+    """
+
+    def setUp(self):
+        df = tempfile.NamedTemporaryFile(delete=False)
+        df.write(b'data')
+        df.close()
+        self.filename = df.name
+        self.cache = datalib.FileCache(max_files=2)
+
+    def tearDown(self):
+        os.unlink(self.filename)
+
+    def test_hit(self):
+        key = self.cache.get_key(self.filename)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, {}, 'message')
+        self.assertEqual(self.cache.get(self.cache.get_key(self.filename)), ({}, 'message'))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_changed_file(self):
+        self.cache.put(self.cache.get_key(self.filename), {}, 'message')
+        with open(self.filename, 'ab') as df:
+            df.write(b'more')
+        self.assertIsNone(self.cache.get(self.cache.get_key(self.filename)))
+
+    def test_discard(self):
+        key = self.cache.get_key(self.filename)
+        self.cache.put(key, {}, 'message')
+        self.cache.discard(self.filename)
+        self.assertIsNone(self.cache.get(key))
+
+    def test_max_files(self):
+        for idx in range(3):
+            self.cache.put(('file{}'.format(idx), 0, 0), {}, idx)
+        self.assertIsNone(self.cache.get(('file0', 0, 0)))
+        self.assertEqual(self.cache.get(('file2', 0, 0)), ({}, 2))
+
+if __name__ == '__main__':
+    unittest.main()
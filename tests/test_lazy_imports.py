@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import sys
+import unittest
+import subprocess
+
+# The top of the source tree, so that the subprocesses below import this
+# copy of `bl3save` rather than any installed one
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_modules(module):
+    """
+    Imports `module` in a fresh interpreter, and returns the set of module
+    names which ended up in `sys.modules` as a result.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+            [base_dir] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p])
+    output = subprocess.check_output([sys.executable, '-c',
+            'import sys, {}; print("\\n".join(sys.modules))'.format(module),
+            ], env=env, text=True)
+    return set(output.split())
+
+class LazyImportTests(unittest.TestCase):
+    """
+    The larger data structures in `bl3save` are only supposed to be loaded
+    when they're used, so that the CLI tools start up quickly.
+    """
+
+    def test_cli_edit_skips_hashes(self):
+        modules = loaded_modules('bl3save.cli_edit')
+        self.assertIn('bl3save.datalib', modules)
+        self.assertNotIn('bl3save._hashes', modules)
+        self.assertNotIn('bl3save._pathhashes', modules)
+
+    def test_cli_edit_skips_save_data(self):
+        modules = loaded_modules('bl3save.cli_edit')
+        self.assertIn('bl3save.bl3save', modules)
+        self.assertNotIn('bl3save._missions', modules)
+        self.assertNotIn('bl3save._maps', modules)
+        self.assertNotIn('bl3save._vehicles', modules)
+
+if __name__ == '__main__':
+    unittest.main()
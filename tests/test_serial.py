@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import unittest
+from bl3save import datalib
+
+# A known-good item (Crader's EM-P5)
+good_serial = 'BL3(A/keqg/yMeLAidiwT5/bWQwqG3OuxeEhDH4LZAPWg1a2HG2imaCQ)'
+
+class BalanceIndexTests(unittest.TestCase):
+    """
+    Tests for `BL3Serial.get_balance_index`, used by `--find`
+    """
+
+    def setUp(self):
+        self.datawrapper = datalib.get_shared_datawrapper()
+        self.good = datalib.BL3Serial(
+                datalib.BL3Serial.decode_serial_base64(good_serial),
+                self.datawrapper)
+
+    def truncated(self, num_bytes):
+        """
+        Returns a validly-encrypted copy of our good item, with its decrypted
+        data cut off after `num_bytes` bytes
+        """
+        return datalib.BL3Serial(
+                datalib.BL3Serial._encrypt_serial(
+                    self.good.decrypted_serial[:num_bytes],
+                    self.good.serial_version,
+                    0),
+                self.datawrapper)
+
+    def test_good_serial(self):
+        self.assertIsNotNone(self.good.get_balance_index())
+
+    def test_truncated_serial(self):
+        for num_bytes in range(4):
+            with self.subTest(num_bytes=num_bytes):
+                self.assertIsNone(self.truncated(num_bytes).get_balance_index())
+
+    def test_find_items_skips_truncated(self):
+        items = [self.truncated(2), self.good]
+        found = self.datawrapper.name_index.find_items(items, 'em-p5')
+        self.assertEqual(found, [self.good])
+
+if __name__ == '__main__':
+    unittest.main()
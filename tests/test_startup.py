@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright (c) 2020-2021 CJ Kucera (cj@apocalyptech.com)
+# 
+# This software is provided 'as-is', without any express or implied warranty.
+# In no event will the authors be held liable for any damages arising from
+# the use of this software.
+# 
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+# 
+# 1. The origin of this software must not be misrepresented; you must not
+#    claim that you wrote the original software. If you use this software in a
+#    product, an acknowledgment in the product documentation would be
+#    appreciated but is not required.
+# 
+# 2. Altered source versions must be plainly marked as such, and must not be
+#    misrepresented as being the original software.
+# 
+# 3. This notice may not be removed or altered from any source distribution.
+
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+# The top of the source tree, so that the subprocesses below import this
+# copy of `bl3save` rather than any installed one
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The module behind each console script (see setup.py)
+scripts = {
+        'bl3-save-edit': 'bl3save.cli_edit',
+        'bl3-save-info': 'bl3save.cli_info',
+        'bl3-save-import-protobuf': 'bl3save.cli_import_protobuf',
+        'bl3-save-import-json': 'bl3save.cli_import_json',
+        'bl3-process-archive-saves': 'bl3save.cli_archive',
+        'bl3-profile-edit': 'bl3save.cli_prof_edit',
+        'bl3-profile-info': 'bl3save.cli_prof_info',
+        'bl3-profile-import-protobuf': 'bl3save.cli_prof_import_protobuf',
+        'bl3-profile-import-json': 'bl3save.cli_prof_import_json',
+        'bl3-items-validate': 'bl3save.cli_items_validate',
+        'bl3': 'bl3save.cli_batch',
+        }
+
+# Maximum time to import each script's module, in milliseconds.  This is
+# several times what it takes on a typical desktop, so that it only trips on
+# real regressions; it can be overridden for slow machines.
+import_budget_ms = float(os.environ.get('BL3_IMPORT_BUDGET_MS', 300))
+
+# Modules which are slow to import, and which none of the scripts should
+# need just to start up
+deferred_modules = [
+        'google.protobuf.json_format',
+        'concurrent.futures',
+        'multiprocessing.shared_memory',
+        ]
+
+def time_import(module):
+    """
+    Imports `module` in a fresh interpreter.  Returns a tuple containing the
+    time the import took (in milliseconds), and the set of module names
+    which were loaded by then.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+            [base_dir] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p])
+    code = '; '.join([
+        'import sys, json, time',
+        'start = time.perf_counter()',
+        'import {}'.format(module),
+        'print(json.dumps([(time.perf_counter()-start)*1000, list(sys.modules)]))',
+        ])
+    output = subprocess.check_output([sys.executable, '-c', code], env=env, text=True)
+    (elapsed, modules) = json.loads(output)
+    return (elapsed, set(modules))
+
+class StartupTests(unittest.TestCase):
+    """
+    Guards against regressions in how long the console scripts take to
+    start up
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # Best of three, to smooth over any noise (and the first run possibly
+        # having to write out bytecode)
+        cls.results = {}
+        for script, module in scripts.items():
+            runs = [time_import(module) for _ in range(3)]
+            cls.results[script] = (min(elapsed for elapsed, _ in runs), runs[-1][1])
+
+    def test_import_budget(self):
+        for script, (elapsed, _) in self.results.items():
+            with self.subTest(script=script):
+                self.assertLess(elapsed, import_budget_ms,
+                        '{} took {:.1f}ms to import'.format(script, elapsed))
+
+    def test_deferred_modules(self):
+        for script, (_, modules) in self.results.items():
+            for deferred in deferred_modules:
+                with self.subTest(script=script, module=deferred):
+                    self.assertNotIn(deferred, modules)
+
+if __name__ == '__main__':
+    unittest.main()